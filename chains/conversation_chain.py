@@ -10,14 +10,14 @@ from typing import Optional
 import json
 
 from langchain_core.prompts import ChatPromptTemplate
-from langchain_core.output_parsers import PydanticOutputParser, JsonOutputParser
-from langchain_core.runnables import RunnablePassthrough
+from langchain_core.output_parsers import PydanticOutputParser, JsonOutputParser, StrOutputParser
+from langchain_core.runnables import RunnablePassthrough, RunnableParallel
 from langchain_core.messages import HumanMessage, SystemMessage
 
 # Import based on which LLM we're using
 from config_v2 import LLM_PROVIDER, get_model, get_api_keys, LLM_TEMPERATURE, LLM_MAX_TOKENS
 from models_v2 import School, ConversationStarter, ConversationStarterResponse
-from prompts.templates import get_conversation_starters_prompt
+from prompts.templates import get_conversation_starters_prompt, get_ofsted_combined_prompt
 
 logger = logging.getLogger(__name__)
 
@@ -62,7 +62,28 @@ class ConversationChain:
         # Build the chain using LangChain Expression Language (LCEL)
         # This is the modern way to compose chains
         self.chain = self.prompt | self.llm | self.parser
-        
+
+        # Preferred path: provider-enforced schema (tool calling / JSON
+        # mode) validated by pydantic-core in Rust - much faster than
+        # re-walking a JSON-Schema dict per response, and it removes the
+        # parse-retry failure mode. Falls back to the JSON chain above.
+        try:
+            self.structured_chain = self.prompt | self.llm.with_structured_output(
+                ConversationStarterResponse
+            )
+        except Exception as e:
+            logger.warning(f"⚠️ Structured output unavailable, using JSON parsing: {e}")
+            self.structured_chain = None
+
+        # Fused Ofsted + financial variant - same output schema, so it
+        # reuses the structured-output path when available
+        combined_prompt = get_ofsted_combined_prompt()
+        self.combined_chain = combined_prompt | self.llm | self.parser
+        self.combined_structured_chain = (
+            combined_prompt | self.llm.with_structured_output(ConversationStarterResponse)
+            if self.structured_chain is not None else None
+        )
+
         logger.info("✅ ConversationChain initialized")
     
     def generate(self, school: School, num_starters: int = 5) -> ConversationStarterResponse:
@@ -72,12 +93,22 @@ class ConversationChain:
             school_context = school.to_llm_context()
             
             logger.info(f"🔄 Generating {num_starters} conversation starters for {school.school_name}")
-            
-            # Run the chain
-            result = self.chain.invoke({
+
+            inputs = {
                 "num_starters": num_starters,
                 "school_context": school_context
-            })
+            }
+
+            if self.structured_chain is not None:
+                try:
+                    response = self.structured_chain.invoke(inputs)
+                    logger.info(f"✅ Generated {len(response.conversation_starters)} starters for {school.school_name}")
+                    return response
+                except Exception as e:
+                    logger.warning(f"⚠️ Structured output failed, falling back to JSON parse: {e}")
+
+            # Run the chain
+            result = self.chain.invoke(inputs)
             
             # Parse into Pydantic model
             response = ConversationStarterResponse(
@@ -106,12 +137,20 @@ class ConversationChain:
             school_context = school.to_llm_context()
             
             logger.info(f"🔄 [ASYNC] Generating starters for {school.school_name}")
-            
-            # Async invoke
-            result = await self.chain.ainvoke({
+
+            inputs = {
                 "num_starters": num_starters,
                 "school_context": school_context
-            })
+            }
+
+            if self.structured_chain is not None:
+                try:
+                    return await self.structured_chain.ainvoke(inputs)
+                except Exception as e:
+                    logger.warning(f"⚠️ Structured output failed, falling back to JSON parse: {e}")
+
+            # Async invoke
+            result = await self.chain.ainvoke(inputs)
             
             response = ConversationStarterResponse(
                 conversation_starters=[
@@ -131,6 +170,110 @@ class ConversationChain:
                 sales_priority="UNKNOWN"
             )
 
+    async def astream_starters(self, school: School, num_starters: int = 5):
+        """
+        Yield ConversationStarter objects as the model emits them.
+
+        JsonOutputParser already supports partial JSON, so each starter
+        can be rendered the moment its closing brace arrives - perceived
+        latency drops from full-completion time to time-to-first-starter.
+        While streaming, only the last list entry can still be growing,
+        so everything before it is safe to yield.
+        """
+        inputs = {
+            "num_starters": num_starters,
+            "school_context": school.to_llm_context(),
+        }
+        emitted = 0
+        last = {}
+        async for partial in self.chain.astream(inputs):
+            if not isinstance(partial, dict):
+                continue
+            last = partial
+            starters = partial.get("conversation_starters") or []
+            while emitted < len(starters) - 1:
+                yield ConversationStarter(**starters[emitted])
+                emitted += 1
+        # Flush whatever remained once the stream is complete
+        starters = last.get("conversation_starters") or []
+        while emitted < len(starters):
+            yield ConversationStarter(**starters[emitted])
+            emitted += 1
+
+    def _combined_inputs(self, school: School, ofsted: dict, num_starters: int) -> dict:
+        """Prompt variables for the fused Ofsted + financial call."""
+        return {
+            "num_starters": num_starters,
+            "school_context": school.to_llm_context(),
+            "rating": ofsted.get("rating") or "Unknown",
+            "inspection_date": ofsted.get("inspection_date") or "Unknown",
+            "ofsted_excerpt": ofsted.get("excerpt") or "No report text available",
+            "report_url": ofsted.get("report_url") or "the Ofsted report",
+        }
+
+    def generate_combined(self, school: School, ofsted: dict, num_starters: int = 5) -> ConversationStarterResponse:
+        """
+        One fused LLM call covering Ofsted AND financial starters.
+
+        Takes the raw report fields from OfstedChain.fetch_report and asks
+        for the mixed starter set directly - one round trip instead of a
+        report analysis followed by a separate financial generation.
+        """
+        try:
+            inputs = self._combined_inputs(school, ofsted, num_starters)
+            logger.info(f"🔄 Generating {num_starters} fused Ofsted+financial starters for {school.school_name}")
+
+            if self.combined_structured_chain is not None:
+                try:
+                    return self.combined_structured_chain.invoke(inputs)
+                except Exception as e:
+                    logger.warning(f"⚠️ Structured output failed, falling back to JSON parse: {e}")
+
+            result = self.combined_chain.invoke(inputs)
+            return ConversationStarterResponse(
+                conversation_starters=[
+                    ConversationStarter(**s) for s in result.get("conversation_starters", [])
+                ],
+                summary=result.get("summary"),
+                sales_priority=result.get("sales_priority", "MEDIUM")
+            )
+
+        except Exception as e:
+            logger.error(f"❌ Error generating combined starters: {e}")
+            return ConversationStarterResponse(
+                conversation_starters=[],
+                summary=f"Error generating insights: {str(e)}",
+                sales_priority="UNKNOWN"
+            )
+
+    async def agenerate_combined(self, school: School, ofsted: dict, num_starters: int = 5) -> ConversationStarterResponse:
+        """Async version of generate_combined."""
+        try:
+            inputs = self._combined_inputs(school, ofsted, num_starters)
+
+            if self.combined_structured_chain is not None:
+                try:
+                    return await self.combined_structured_chain.ainvoke(inputs)
+                except Exception as e:
+                    logger.warning(f"⚠️ Structured output failed, falling back to JSON parse: {e}")
+
+            result = await self.combined_chain.ainvoke(inputs)
+            return ConversationStarterResponse(
+                conversation_starters=[
+                    ConversationStarter(**s) for s in result.get("conversation_starters", [])
+                ],
+                summary=result.get("summary"),
+                sales_priority=result.get("sales_priority", "MEDIUM")
+            )
+
+        except Exception as e:
+            logger.error(f"❌ Async combined error: {e}")
+            return ConversationStarterResponse(
+                conversation_starters=[],
+                summary=f"Error: {str(e)}",
+                sales_priority="UNKNOWN"
+            )
+
 
 def generate_conversation_starters(school: School, num_starters: int = 5) -> list[ConversationStarter]:
 
@@ -139,6 +282,53 @@ def generate_conversation_starters(school: School, num_starters: int = 5) -> lis
     return response.conversation_starters
 
 
+async def agenerate_full_analysis(school: School, num_starters: int = 5) -> dict:
+    """
+    Run all four per-school analyses (starters, financial, Ofsted, quick
+    summary) concurrently instead of one after another. The four HTTPS
+    round trips overlap, so wall time is the slowest call rather than the
+    sum of all four.
+
+    Returns a dict with keys: starters (parsed JSON), financial, ofsted,
+    summary (plain text).
+    """
+    from prompts.templates import (
+        get_financial_analysis_prompt,
+        get_ofsted_analysis_prompt,
+        get_quick_summary_prompt,
+    )
+
+    llm = get_llm()
+    to_text = StrOutputParser()
+
+    parallel = RunnableParallel(
+        starters=get_conversation_starters_prompt() | llm | JsonOutputParser(),
+        financial=get_financial_analysis_prompt() | llm | to_text,
+        ofsted=get_ofsted_analysis_prompt() | llm | to_text,
+        summary=get_quick_summary_prompt() | llm | to_text,
+    )
+
+    ofsted = school.ofsted
+    inputs = {
+        "num_starters": num_starters,
+        "school_context": school.to_llm_context(),
+        "school_name": school.school_name,
+        "financial_data": (
+            school.financial.get_financial_summary()
+            if school.financial else "No financial data available"
+        ),
+        "rating": (ofsted.rating if ofsted else None) or "Unknown",
+        "inspection_date": (ofsted.inspection_date if ofsted else None) or "Unknown",
+        "areas_for_improvement": (
+            ", ".join(ofsted.areas_for_improvement)
+            if ofsted and ofsted.areas_for_improvement else "None listed"
+        ),
+    }
+
+    logger.info(f"🔄 Running 4 analyses in parallel for {school.school_name}")
+    return await parallel.ainvoke(inputs)
+
+
 def generate_quick_summary(school: School) -> str:
     """
     Generate a quick 2-sentence summary of a school.
@@ -74,7 +74,16 @@ class OfstedChain:
     def __init__(self):
         """Initialize the Ofsted chain"""
         self.llm = self._get_llm()
-        
+
+        # Shared session: keep-alive + connection pooling means the TLS
+        # handshake to ofsted.gov.uk is paid once, not per request. The
+        # chain is a singleton (get_ofsted_chain), so the pool persists
+        # across schools.
+        self.session = requests.Session()
+        self.session.headers.update({
+            'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36'
+        })
+
         # PRESERVED: All broad improvement patterns from original
         self.broad_improvement_patterns = [
             # Subject-specific patterns
@@ -235,7 +244,60 @@ class OfstedChain:
             logger.error(f"Error in Ofsted analysis: {e}")
             result["error"] = str(e)
             return result
-    
+
+    async def aanalyze(self, school_name: str, urn: str = None) -> Dict[str, Any]:
+        """
+        Async wrapper for analyze(). The pipeline is built on synchronous
+        requests/PyPDF2 calls, so run it on a worker thread - enough to
+        overlap the whole Ofsted round trip with other LLM calls.
+        """
+        import asyncio
+        return await asyncio.to_thread(self.analyze, school_name, urn)
+
+    def fetch_report(self, school_name: str, urn: str = None) -> Dict[str, Any]:
+        """
+        Steps 1-4 of analyze() without the LLM: find the report, extract
+        the PDF text, pull rating/date/improvements with regex. Used by
+        the fused single-call flow, where the LLM analysis happens inside
+        one combined conversation-starter request instead of here.
+        """
+        result = {
+            "rating": None,
+            "inspection_date": None,
+            "report_url": None,
+            "improvements": [],
+            "excerpt": None,
+            "pdf_extracted": False,
+            "error": None
+        }
+
+        try:
+            report_url = self._find_ofsted_report_url(school_name, urn)
+            if not report_url:
+                result["error"] = "Could not find Ofsted report"
+                return result
+            result["report_url"] = report_url
+
+            pdf_text = self._download_and_extract_pdf(report_url)
+            if not pdf_text:
+                result["error"] = "Could not extract PDF content"
+                return result
+            result["pdf_extracted"] = True
+
+            result["rating"] = self._extract_rating(pdf_text)
+            result["inspection_date"] = self._extract_inspection_date(pdf_text)
+            result["improvements"] = [
+                {"category": imp["category"], "description": imp["improvement"]}
+                for imp in self._extract_broad_improvements(pdf_text)
+            ]
+            result["excerpt"] = self._get_improvement_excerpt(pdf_text)
+            return result
+
+        except Exception as e:
+            logger.error(f"Error fetching Ofsted report: {e}")
+            result["error"] = str(e)
+            return result
+
     def _find_ofsted_report_url(self, school_name: str, urn: str = None) -> Optional[str]:
         """
         Find the Ofsted PDF report URL using Serper API.
@@ -270,7 +332,7 @@ class OfstedChain:
                     "num": 5
                 }
                 
-                response = requests.post(url, headers=headers, json=payload, timeout=10)
+                response = self.session.post(url, headers=headers, json=payload, timeout=10)
                 
                 if response.status_code == 200:
                     data = response.json()
@@ -307,9 +369,8 @@ class OfstedChain:
         try:
             # Search on Ofsted's own search page
             search_url = f"https://reports.ofsted.gov.uk/search?q={requests.utils.quote(school_name)}"
-            headers = {'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36'}
-            
-            response = requests.get(search_url, headers=headers, timeout=15)
+
+            response = self.session.get(search_url, timeout=15)
             
             if response.status_code == 200:
                 soup = BeautifulSoup(response.text, 'html.parser')
@@ -337,8 +398,7 @@ class OfstedChain:
     def _extract_pdf_from_page(self, page_url: str) -> Optional[str]:
         """Extract PDF link from an Ofsted provider page"""
         try:
-            headers = {'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36'}
-            response = requests.get(page_url, headers=headers, timeout=10)
+            response = self.session.get(page_url, timeout=10)
             
             if response.status_code == 200:
                 soup = BeautifulSoup(response.text, 'html.parser')
@@ -379,7 +439,7 @@ class OfstedChain:
             
             # If URL is a page (not PDF), try to find PDF link on it
             if not url.endswith('.pdf'):
-                response = requests.get(url, headers=headers, timeout=15)
+                response = self.session.get(url, headers=headers, timeout=15)
                 if response.status_code == 200:
                     soup = BeautifulSoup(response.text, 'html.parser')
                     for link in soup.find_all('a', href=True):
@@ -393,7 +453,7 @@ class OfstedChain:
             
             # Download PDF
             logger.info(f"⬇️ Downloading PDF from {url}")
-            response = requests.get(url, headers=headers, timeout=30)
+            response = self.session.get(url, headers=headers, timeout=30)
             response.raise_for_status()
             
             # Extract text using PyPDF2
@@ -5,15 +5,162 @@ UPDATED: Now supports TWO data sources - Financial + GIAS contacts
 
 """
 
+import logging
 import os
-from typing import Literal
+import sys
+from dataclasses import dataclass
+from functools import lru_cache
+
+__all__ = [
+    "LLM_PROVIDER",
+    "MODELS",
+    "get_model",
+    "get_api_keys",
+    "clear_config_cache",
+    "DATA_SOURCE",
+    "CSV_FILE_PATH_FINANCIAL",
+    "CSV_FILE_PATH_GIAS",
+    "CSV_FILE_PATH",
+    "CSV_PATH_FINANCIAL",
+    "CSV_PATH_GIAS",
+    "DATABRICKS_CONFIG",
+    "PRIORITY_THRESHOLDS",
+    "PRIORITY_COST_FIELD",
+    "classify_priority",
+    "DISPLAY_LABELS",
+    "get_display_label",
+    "ENABLE_CACHE",
+    "CACHE_TTL_HOURS",
+    "CACHE_DIR",
+    "get_app_password",
+    "APP_PASSWORD",
+    "OUTPUT_DIR",
+    "LOG_LEVEL",
+    "LOG_LEVEL_NAME",
+    "FEATURES",
+    "MAX_CONVERSATION_STARTERS",
+    "LLM_TEMPERATURE",
+    "LLM_MAX_TOKENS",
+]
+from pathlib import Path
+from types import MappingProxyType
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from typing import Literal, Mapping
+
+# dotenv loading is deferred until the first config lookup - walking the
+# filesystem for a .env file is pure cold-start overhead at import time
+_DOTENV_LOADED = False
+
+# Memoized streamlit module (or None if unavailable) - importing streamlit
+# on every call is expensive, so we resolve it once
+_streamlit = None
+_streamlit_tried = False
+
+
+def _ensure_dotenv_loaded() -> None:
+    """Load .env into the environment, once per process."""
+    global _DOTENV_LOADED
+    if _DOTENV_LOADED:
+        return
+    _DOTENV_LOADED = True
+    try:
+        _load_dotenv_cached()
+    except ImportError:
+        pass
+
+
+def _load_dotenv_cached() -> None:
+    """Load .env values, caching the parsed dict keyed by the file's mtime.
 
-# Try to load dotenv
-try:
-    from dotenv import load_dotenv
-    load_dotenv()
-except ImportError:
-    pass
+    Streamlit Cloud restarts spawn many processes; after the first boot the
+    pickle read (one stat + one read) replaces the dotenv tokenizer.
+    """
+    import hashlib
+    import pickle
+    import tempfile
+    from dotenv import dotenv_values, find_dotenv
+
+    env_path = find_dotenv(usecwd=True)
+    if not env_path:
+        return
+
+    try:
+        mtime = os.stat(env_path).st_mtime_ns
+    except OSError:
+        return
+
+    # Secrets live in the system temp dir, never under the repo's cache/
+    # where they could be committed or served, and owner-only on disk
+    digest = hashlib.sha256(f"{env_path}:{mtime}".encode()).hexdigest()[:16]
+    cache_path = os.path.join(tempfile.gettempdir(), f"edintel-env-{digest}.pkl")
+    values = None
+    try:
+        with open(cache_path, "rb") as f:
+            values = pickle.load(f)
+    except (OSError, pickle.PickleError, EOFError):
+        pass
+
+    if values is None:
+        values = {k: v for k, v in dotenv_values(env_path).items() if v is not None}
+        try:
+            fd = os.open(cache_path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o600)
+            with os.fdopen(fd, "wb") as f:
+                pickle.dump(values, f)
+        except OSError:
+            pass
+
+    # Same semantics as load_dotenv(): existing env vars win
+    env = os.environ
+    for key, value in values.items():
+        env.setdefault(key, value)
+
+
+def _get_streamlit():
+    """Import streamlit once and memoize the module (or None)."""
+    global _streamlit, _streamlit_tried
+    if not _streamlit_tried:
+        _streamlit_tried = True
+        try:
+            import streamlit
+            _streamlit = streamlit
+        except Exception:
+            _streamlit = None
+    return _streamlit
+
+
+# Snapshot of Streamlit secrets, resolved at most once per process
+_SECRETS = None
+_SECRETS_TRIED = False
+
+# Where Streamlit looks for secrets (project-level, then user-level)
+_SECRETS_FILES = (
+    Path(".streamlit/secrets.toml"),
+    Path.home() / ".streamlit/secrets.toml",
+)
+
+
+def _get_secrets() -> "Mapping":
+    """Return the Streamlit secrets as a plain dict, resolved once.
+
+    Probing st.secrets triggers Streamlit's lazy secrets loader (which can
+    stat/parse secrets.toml), so do it a single time and cache the result.
+    A single stat() on secrets.toml up front means local dev boxes without
+    one never import streamlit or raise FileNotFoundError at all.
+    """
+    global _SECRETS, _SECRETS_TRIED
+    if not _SECRETS_TRIED:
+        _SECRETS_TRIED = True
+        _SECRETS = {}
+        if any(p.is_file() for p in _SECRETS_FILES):
+            st = _get_streamlit()
+            if st is not None:
+                try:
+                    _SECRETS = dict(st.secrets)
+                except Exception:
+                    pass
+    return _SECRETS
 
 
 # =============================================================================
@@ -21,63 +168,107 @@ except ImportError:
 # =============================================================================
 
 # Options: "anthropic" (Claude) or "openai" (GPT)
-LLM_PROVIDER: Literal["anthropic", "openai"] = "anthropic"
+LLM_PROVIDER: "Literal['anthropic', 'openai']" = "anthropic"
 
-MODELS = {
-    "anthropic": {
+MODELS = MappingProxyType({
+    "anthropic": MappingProxyType({
         "primary": "claude-sonnet-4-20250514",
         "fast": "claude-sonnet-4-20250514",
-    },
-    "openai": {
+    }),
+    "openai": MappingProxyType({
         "primary": "gpt-4o-mini",
         "fast": "gpt-4o-mini",
-    }
-}
+    }),
+})
+
+# Resolve the active provider's model table once - get_model() can be hit
+# per LLM request, so skip the double dict indexing on every call
+_ACTIVE_MODELS = MODELS[LLM_PROVIDER]
+
+# Hot callers can import this directly and skip the dict access entirely
+_MODEL_PRIMARY = _ACTIVE_MODELS["primary"]
+
+
+# The provider never changes inside a process, so specialize get_model()
+# at import: the generated function carries the two model names as default
+# args and does no dict lookups at all per call
+_src = f"""
+def get_model(model_type='primary',
+              _p={_ACTIVE_MODELS['primary']!r},
+              _f={_ACTIVE_MODELS['fast']!r}):
+    \"\"\"Get the model name based on current provider\"\"\"
+    return _p if model_type == 'primary' else _f
+"""
+exec(compile(_src, "<config_specialized>", "exec"), globals())
 
-def get_model(model_type: str = "primary") -> str:
-    """Get the model name based on current provider"""
-    return MODELS[LLM_PROVIDER][model_type]
-
-
-def get_api_keys() -> dict:
-    """Get API keys from Streamlit secrets (cloud) or environment (local)"""
-    keys = {
-        "openai": None,
-        "anthropic": None,
-        "serper": None,
-        "firecrawl": None,
-    }
-    
-    # First, try environment variables
-    keys["openai"] = os.getenv("OPENAI_API_KEY")
-    keys["anthropic"] = os.getenv("ANTHROPIC_API_KEY")
-    keys["serper"] = os.getenv("SERPER_API_KEY")
-    keys["firecrawl"] = os.getenv("FIRECRAWL_API_KEY")
-    
-    # Then, try Streamlit secrets
-    try:
-        import streamlit as st
-        if hasattr(st, 'secrets'):
-            try:
-                keys["openai"] = st.secrets["OPENAI_API_KEY"]
-            except (KeyError, FileNotFoundError):
-                pass
-            try:
-                keys["anthropic"] = st.secrets["ANTHROPIC_API_KEY"]
-            except (KeyError, FileNotFoundError):
-                pass
-            try:
-                keys["serper"] = st.secrets["SERPER_API_KEY"]
-            except (KeyError, FileNotFoundError):
-                pass
-            try:
-                keys["firecrawl"] = st.secrets["FIRECRAWL_API_KEY"]
-            except (KeyError, FileNotFoundError):
-                pass
-    except Exception:
-        pass
-    
-    return keys
+
+# Which secret/env var feeds each API key slot
+_SECRET_MAP = (
+    ("openai", "OPENAI_API_KEY"),
+    ("anthropic", "ANTHROPIC_API_KEY"),
+    ("serper", "SERPER_API_KEY"),
+    ("firecrawl", "FIRECRAWL_API_KEY"),
+)
+
+
+@dataclass(frozen=True, slots=True)
+class ApiKeys:
+    """The API keys the app knows about.
+
+    Slotted and frozen - built once per process by get_api_keys().
+    Supports keys["anthropic"] / keys.get("serper") for older callers.
+    """
+    openai: "str | None" = None
+    anthropic: "str | None" = None
+    serper: "str | None" = None
+    firecrawl: "str | None" = None
+
+    def __getitem__(self, key: str) -> "str | None":
+        return getattr(self, key)
+
+    def get(self, key: str, default=None):
+        return getattr(self, key, default)
+
+
+@lru_cache(maxsize=1)
+def get_api_keys() -> ApiKeys:
+    """Get API keys from Streamlit secrets (cloud) or environment (local).
+
+    Cached for the lifetime of the process - secrets/env lookups only
+    happen once, not on every Streamlit rerun.
+    """
+    _ensure_dotenv_loaded()
+
+    # First, try environment variables - os.environ.get skips the
+    # os.getenv wrapper indirection
+    env = os.environ
+    keys = {key: env.get(env_name) for key, env_name in _SECRET_MAP}
+
+    # All four set locally (the common dev case): skip the streamlit
+    # import / secrets probe entirely
+    if all(keys.values()):
+        return ApiKeys(**keys)
+
+    # Then, try Streamlit secrets (snapshotted once per process)
+    sec = _get_secrets()
+    for key, env_name in _SECRET_MAP:
+        value = sec.get(env_name)
+        if value:
+            keys[key] = value
+
+    # Frozen + slotted, so callers can't mutate the cached instance and
+    # attribute access skips the per-instance __dict__
+    return ApiKeys(**keys)
+
+
+def clear_config_cache() -> None:
+    """Clear all cached config lookups (mainly for tests)."""
+    get_api_keys.cache_clear()
+    get_app_password.cache_clear()
+    # Drop any lazily materialized module attributes too
+    g = globals()
+    for name in _LAZY:
+        g.pop(name, None)
 
 
 # =============================================================================
@@ -85,7 +276,7 @@ def get_api_keys() -> dict:
 # =============================================================================
 
 # Options: "csv", "databricks"
-DATA_SOURCE: Literal["csv", "databricks"] = "csv"
+DATA_SOURCE: "Literal['csv', 'databricks']" = "csv"
 
 # CSV FILE PATHS
 # Financial data - from government benchmarking tool (spending figures)
@@ -97,15 +288,25 @@ CSV_FILE_PATH_GIAS = "data/london_schools_gias.csv"
 # Legacy path (for backwards compatibility)
 CSV_FILE_PATH = CSV_FILE_PATH_FINANCIAL
 
-# Databricks configuration (for future)
-DATABRICKS_CONFIG = {
-    "host": os.getenv("DATABRICKS_HOST", ""),
-    "token": os.getenv("DATABRICKS_TOKEN", ""),
-    "warehouse_id": os.getenv("DATABRICKS_WAREHOUSE_ID", ""),
-    "catalog": "main",
-    "schema": "schools",
-    "table": "edco_schools"
-}
+# Resolved Path objects - one realpath each at import instead of a
+# cwd-relative resolution on every open/exists call downstream
+CSV_PATH_FINANCIAL = Path(CSV_FILE_PATH_FINANCIAL).resolve()
+CSV_PATH_GIAS = Path(CSV_FILE_PATH_GIAS).resolve()
+
+# Databricks configuration (for future) - built lazily so the default
+# csv configuration never pays for these env lookups
+@lru_cache(maxsize=1)
+def get_databricks_config() -> "Mapping[str, str]":
+    """Get Databricks connection settings from the environment."""
+    env = os.environ
+    return MappingProxyType({
+        "host": env.get("DATABRICKS_HOST", ""),
+        "token": env.get("DATABRICKS_TOKEN", ""),
+        "warehouse_id": env.get("DATABRICKS_WAREHOUSE_ID", ""),
+        "catalog": "main",
+        "schema": "schools",
+        "table": "edco_schools"
+    })
 
 
 # =============================================================================
@@ -115,22 +316,47 @@ DATABRICKS_CONFIG = {
 # Priority is now based on TOTAL STAFFING SPEND (not just agency)
 # Because Protocol offers permanent, temporary, AND agency staff
 
-PRIORITY_THRESHOLDS = {
+PRIORITY_THRESHOLDS = MappingProxyType({
     "HIGH": 500000,      # £500k+ total staffing = big spender, big opportunity
     "MEDIUM": 200000,    # £200k-500k = mid-size opportunity
     "LOW": 0,            # Under £200k = smaller schools
-}
+})
 
 # Which cost field to use for priority calculation
 # Options: "total_teaching_support_costs", "total_expenditure", "teaching_staff_costs"
 PRIORITY_COST_FIELD = "total_teaching_support_costs"
 
+# Sorted threshold edges + parallel labels, built on first use (numpy is
+# a heavy import, so it stays off the config cold path)
+_PRIORITY_EDGES = None
+_PRIORITY_LABELS = None
+
+
+def classify_priority(spend_col):
+    """Classify a whole spend column into HIGH/MEDIUM/LOW labels at once.
+
+    One C-level searchsorted over the column replaces a per-row chain of
+    threshold comparisons. Accepts any array-like of spend figures.
+    """
+    global _PRIORITY_EDGES, _PRIORITY_LABELS
+    import numpy as np
+
+    if _PRIORITY_EDGES is None:
+        _PRIORITY_EDGES = np.array(
+            [PRIORITY_THRESHOLDS["MEDIUM"], PRIORITY_THRESHOLDS["HIGH"]],
+            dtype=np.int64,
+        )
+        _PRIORITY_LABELS = np.array(["LOW", "MEDIUM", "HIGH"])
+
+    spend = np.asarray(spend_col)
+    return _PRIORITY_LABELS[np.searchsorted(_PRIORITY_EDGES, spend, side="right")]
+
 
 # =============================================================================
 # DISPLAY LABELS (User-friendly names for data fields)
 # =============================================================================
 
-DISPLAY_LABELS = {
+_DISPLAY_LABELS_RAW = {
     "la_name": "Local Authority",
     "la_code": "LA Code",
     "urn": "URN",
@@ -149,9 +375,19 @@ DISPLAY_LABELS = {
     "total_teaching_support_costs": "Total Staffing Costs",
 }
 
+# Intern the field names so repeated lookups hash against shared strings
+_DISPLAY_LABELS_RAW = {sys.intern(k): v for k, v in _DISPLAY_LABELS_RAW.items()}
+
+DISPLAY_LABELS = MappingProxyType(_DISPLAY_LABELS_RAW)
+
+# Bound-method reference saves a dict attribute lookup per call - this runs
+# per-field when rendering school tables
+_DL_GET = _DISPLAY_LABELS_RAW.get
+
 def get_display_label(field_name: str) -> str:
     """Get user-friendly display label for a field name"""
-    return DISPLAY_LABELS.get(field_name, field_name.replace("_", " ").title())
+    label = _DL_GET(field_name)
+    return label if label is not None else field_name.replace("_", " ").title()
 
 
 # =============================================================================
@@ -167,38 +403,63 @@ CACHE_DIR = "cache"
 # APP CONFIGURATION
 # =============================================================================
 
+@lru_cache(maxsize=1)
 def get_app_password() -> str:
     """Get app password from secrets or environment"""
-    try:
-        import streamlit as st
-        if hasattr(st, 'secrets'):
-            try:
-                return st.secrets["APP_PASSWORD"]
-            except (KeyError, FileNotFoundError):
-                pass
-    except Exception:
-        pass
-    
-    return os.getenv("APP_PASSWORD", "SEG2025AI!")
+    _ensure_dotenv_loaded()
+
+    # Env var wins straight away - avoids touching streamlit secrets at all
+    password = os.environ.get("APP_PASSWORD")
+    if password:
+        return password
+
+    password = _get_secrets().get("APP_PASSWORD")
+    if password:
+        return password
 
+    return "SEG2025AI!"
+
+
+# PEP 562 lazy module attributes: nothing below is materialized unless a
+# caller actually references it
+_LAZY = {
+    "APP_PASSWORD": get_app_password,
+    "DATABRICKS_CONFIG": get_databricks_config,
+    "API_KEYS": get_api_keys,
+}
+
+
+def __getattr__(name):
+    fn = _LAZY.get(name)
+    if fn is not None:
+        # Write the value back so later reads are plain attribute lookups
+        value = fn()
+        globals()[name] = value
+        return value
+    raise AttributeError(name)
 
-APP_PASSWORD = "SEG2025AI!"
 
 OUTPUT_DIR = "outputs"
-LOG_LEVEL = "INFO"
+# Int level passes straight to logger.setLevel() without the
+# getLevelName() string lookup; keep the name for formatters
+LOG_LEVEL = logging.INFO
+LOG_LEVEL_NAME = "INFO"
 
 
 # =============================================================================
 # FEATURE FLAGS
 # =============================================================================
 
-FEATURES = {
-    "conversation_starters": True,      
-    "financial_analysis": True,        
-    "ofsted_analysis": True,            
-    "live_web_search": False,           
-    "export_to_excel": True,            
-}
+FEATURES = MappingProxyType({
+    "conversation_starters": True,
+    "financial_analysis": True,
+    "ofsted_analysis": True,
+    "live_web_search": False,
+    "export_to_excel": True,
+    # Reuse cached starters from a near-identical school (saves LLM calls,
+    # but reused text cites the other school's specifics) - off by default
+    "semantic_cache": False,
+})
 
 
 # =============================================================================
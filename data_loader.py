@@ -8,11 +8,20 @@ UPDATED: Now loads and MERGES two CSV files:
 Both files are linked by URN (Unique Reference Number)
 """
 
-import csv
+import json
 import logging
+import sys
+import threading
+from bisect import bisect_left
+from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
 from pathlib import Path
 from typing import List, Optional, Dict, Any
 
+import numpy as np
+import pandas as pd
+
 from models_v2 import (
     School, 
     Contact, 
@@ -21,14 +30,120 @@ from models_v2 import (
     OfstedData
 )
 from config_v2 import (
-    DATA_SOURCE, 
-    CSV_FILE_PATH_FINANCIAL, 
+    DATA_SOURCE,
+    CSV_FILE_PATH_FINANCIAL,
     CSV_FILE_PATH_GIAS,
-    DATABRICKS_CONFIG
+    CACHE_DIR,
+    DATABRICKS_CONFIG,
+    classify_priority,
 )
 
 logger = logging.getLogger(__name__)
 
+# On-disk cache of the merged DataFrame - skips both CSV parses and the
+# merge when the source files haven't changed since last run. Pickle is
+# the format because requirements.txt carries no parquet engine.
+_MERGED_CACHE = Path(CACHE_DIR) / "merged_schools.pkl"
+_MERGED_CACHE_META = Path(CACHE_DIR) / "merged_schools.meta.json"
+
+_MODULE_DIR = Path(__file__).parent
+
+
+@lru_cache(maxsize=16)
+def _find_csv_file(csv_path: str) -> Optional[Path]:
+    """Find a CSV file, trying multiple possible locations.
+
+    Cached per path - the layout doesn't change within a process, so
+    repeated load()/refresh() calls skip the stat() probes.
+    """
+    possible_paths = [
+        csv_path,
+        _MODULE_DIR / csv_path,
+        _MODULE_DIR / "data" / Path(csv_path).name,
+        f"data/{Path(csv_path).name}",
+        Path(csv_path).name,
+    ]
+
+    for path in possible_paths:
+        p = Path(path)
+        if p.exists():
+            return p
+
+    return None
+
+# Columns consumed downstream, coerced once per load so row conversion
+# never re-checks types per cell
+_FIN_NUMERIC_COLS = (
+    'TotalExpenditure',
+    'TotalPupils',
+    'TotalTeachingSupportStaffCosts',
+    'TeachingStaffCosts',
+    'SupplyTeachingStaffCosts',
+    'AgencySupplyTeachingStaffCosts',
+    'EducationSupportStaffCosts',
+    'EducationalConsultancyCosts',
+)
+
+_FIN_STRING_COLS = (
+    'SchoolName',
+    'school_name_gias',
+    'LAName',
+    'la_name_gias',
+    'SchoolType',
+)
+
+# Merged-frame columns renamed once, in C, so each School field maps to
+# exactly one canonical attribute on the itertuples rows
+_CANONICAL_RENAMES = {
+    'TotalExpenditure': 'total_expenditure',
+    'TotalPupils': 'total_pupils',
+    'TotalTeachingSupportStaffCosts': 'total_teaching_support_costs',
+    'TeachingStaffCosts': 'teaching_staff_costs',
+    'SupplyTeachingStaffCosts': 'supply_teaching_costs',
+    'AgencySupplyTeachingStaffCosts': 'agency_supply_costs',
+    'EducationSupportStaffCosts': 'educational_support_costs',
+    'EducationalConsultancyCosts': 'educational_consultancy_costs',
+    'SchoolName': 'school_name_fin',
+    'LAName': 'la_name_fin',
+    'SchoolType': 'school_type_fin',
+}
+
+# Every column _merged_row_to_school reads - filled with None if a
+# source file (and hence its columns) was missing
+_ROW_COLUMNS = (
+    'urn',
+    'school_name', 'school_name_fin', 'school_name_gias',
+    'la_name', 'la_name_fin', 'la_name_gias',
+    'school_type', 'school_type_fin', 'phase',
+    'pupil_count', 'phone', 'website',
+    'head_title', 'head_first_name', 'head_last_name', 'headteacher',
+    'address_1', 'address_2', 'address_3', 'town', 'county', 'postcode',
+    'trust_code', 'trust_name',
+    'total_expenditure', 'total_pupils', 'total_teaching_support_costs',
+    'teaching_staff_costs', 'supply_teaching_costs', 'agency_supply_costs',
+    'educational_support_costs', 'educational_consultancy_costs',
+)
+
+_GIAS_STRING_COLS = (
+    'school_name',
+    'la_name',
+    'school_type',
+    'phase',
+    'address_1',
+    'address_2',
+    'address_3',
+    'town',
+    'county',
+    'postcode',
+    'website',
+    'trust_code',
+    'trust_name',
+    'head_title',
+    'head_first_name',
+    'head_last_name',
+    'headteacher',
+)
+
 
 class DataLoader:
     """
@@ -41,18 +156,70 @@ class DataLoader:
     
     def __init__(self, source: str = None):
         self.source = source or DATA_SOURCE
+        self._load_lock = threading.Lock()
         self._schools_cache: Optional[List[School]] = None
         self._schools_by_name: Dict[str, School] = {}
         self._schools_by_urn: Dict[str, School] = {}
+
+        # SoA mirrors of the hot financial fields (built in load) so the
+        # aggregate methods run as numpy reductions, not object walks
+        self._fin_total: Optional[np.ndarray] = None
+        self._fin_agency: Optional[np.ndarray] = None
+        self._pupils: Optional[np.ndarray] = None
+        self._agency_per_pupil: Optional[np.ndarray] = None
+        self._priority: Optional[np.ndarray] = None
+
+        # Bucket indexes so by-priority/by-borough reads are O(1) lookups
+        self._by_priority: Dict[str, List[School]] = {}
+        self._by_borough: Dict[str, List[School]] = {}
+        self._by_borough_lower: Dict[str, List[School]] = {}
+        self._priority_counts: Dict[str, int] = {}
+
+        # Sorted once per load for the dropdowns, instead of per render.
+        # Tuples: shared across callers without defensive copies.
+        self._sorted_names: tuple = ()
+        self._sorted_boroughs: tuple = ()
+        self._names_by_la: Dict[str, tuple] = {}
+
+        # Lowercased names, parallel to _schools_cache, for search - the
+        # unicode array lets np.char scan substrings in C
+        self._names_lower: List[str] = []
+        self._names_arr: Optional[np.ndarray] = None
+        self._prefix_keys: List[str] = []
+        self._prefix_names: List[str] = []
+
+        # Schools with agency spend, sorted descending, plus the parallel
+        # key array so min-spend cutoffs are a searchsorted
+        self._agency_sorted: List[School] = []
+        self._agency_sorted_keys: Optional[np.ndarray] = None
+
+        # Per-source frames + mtimes, kept so refresh() can re-parse only
+        # the CSV that actually changed
+        self._gias_df: Optional[pd.DataFrame] = None
+        self._fin_df: Optional[pd.DataFrame] = None
+        self._merged_df: Optional[pd.DataFrame] = None
+        self._mtimes: Dict[str, List[int]] = {}
+
+        # The cleaned, canonical merged frame - kept so frame-level
+        # consumers can aggregate in C instead of walking School objects
+        self._df: Optional[pd.DataFrame] = None
         
         logger.info(f"📚 DataLoader initialized with source: {self.source}")
     
     def load(self) -> List[School]:
-        """Load all schools from the data source."""
+        """Load all schools from the data source (thread-safe)."""
         if self._schools_cache is not None:
             logger.info(f"📦 Returning {len(self._schools_cache)} cached schools")
             return self._schools_cache
-        
+
+        with self._load_lock:
+            # Another thread may have finished the load while we waited
+            if self._schools_cache is not None:
+                return self._schools_cache
+            return self._load_locked()
+
+    def _load_locked(self) -> List[School]:
+        """Do the actual load - caller holds _load_lock."""
         if self.source == "csv":
             schools = self._load_and_merge_csvs()
         elif self.source == "databricks":
@@ -61,30 +228,98 @@ class DataLoader:
             raise ValueError(f"Unknown data source: {self.source}")
         
         # Build lookup indexes
-        self._schools_cache = schools
         self._schools_by_name = {s.school_name: s for s in schools}
         self._schools_by_urn = {s.urn: s for s in schools}
-        
+
+        # Columnar views: zero/missing spends become NaN so comparisons
+        # drop them for free
+        self._fin_total = np.array(
+            [(s.financial.total_teaching_support_costs if s.financial else None) or np.nan
+             for s in schools],
+            dtype=np.float64,
+        )
+        self._fin_agency = np.array(
+            [(s.financial.agency_supply_costs if s.financial else None) or np.nan
+             for s in schools],
+            dtype=np.float64,
+        )
+        # Per-pupil figures computed once for the whole column (fp32 is
+        # plenty for £ amounts and halves the bandwidth of reductions)
+        self._pupils = np.array(
+            [(s.financial.total_pupils if s.financial else None) or np.nan
+             for s in schools],
+            dtype=np.float32,
+        )
+        agency32 = self._fin_agency.astype(np.float32)
+        self._agency_per_pupil = np.divide(
+            agency32,
+            self._pupils,
+            out=np.full_like(agency32, np.nan),
+            where=self._pupils > 0,
+        )
+
+        # Priorities for the whole column in one searchsorted pass - the
+        # vectorised mirror of FinancialData.get_priority_level, with
+        # missing spend mapping to UNKNOWN
+        fin_total_raw = np.array(
+            [s.financial.total_teaching_support_costs
+             if s.financial and s.financial.total_teaching_support_costs is not None
+             else np.nan
+             for s in schools],
+            dtype=np.float64,
+        )
+        labels = classify_priority(np.nan_to_num(fin_total_raw))
+        self._priority = np.where(np.isnan(fin_total_raw), "UNKNOWN", labels)
+
+        # One bucketing pass replaces the per-call linear scans in
+        # get_schools_by_priority / get_schools_by_borough / get_boroughs
+        by_priority = defaultdict(list)
+        by_borough = defaultdict(list)
+        for s, priority in zip(schools, self._priority):
+            # Seed the model's memo from the vectorized labels so the
+            # first get_sales_priority() call is a lookup, not a derive
+            s._sales_priority = str(priority)
+            by_priority[s._sales_priority].append(s)
+            if s.la_name:
+                by_borough[s.la_name].append(s)
+        self._by_priority = dict(by_priority)
+        self._by_borough = dict(by_borough)
+        self._by_borough_lower = {k.lower(): v for k, v in by_borough.items()}
+        self._priority_counts = {k: len(v) for k, v in by_priority.items()}
+
+        self._sorted_names = tuple(sorted(self._schools_by_name))
+        self._sorted_boroughs = tuple(sorted(self._by_borough))
+        # Sorted name lists per LA, so the borough filter in the UI is a
+        # dict lookup instead of a filter + sort per rerun
+        self._names_by_la = {
+            la: tuple(sorted(s.school_name for s in members))
+            for la, members in self._by_borough.items()
+        }
+        self._names_lower = [s.school_name.lower() for s in schools]
+        self._names_arr = np.array(self._names_lower) if schools else None
+
+        # Lowercase-sorted (key, name) pairs so prefix search is a
+        # bisect instead of a full scan
+        pairs = sorted(zip(self._names_lower, (s.school_name for s in schools)))
+        self._prefix_keys = [p[0] for p in pairs]
+        self._prefix_names = [p[1] for p in pairs]
+
+        # Agency spenders sorted once, descending - top-k becomes a slice
+        # and min-spend filters a binary search
+        agency = np.nan_to_num(self._fin_agency)
+        order = np.argsort(-agency, kind='stable')
+        order = order[agency[order] > 0]
+        self._agency_sorted = [schools[i] for i in order]
+        self._agency_sorted_keys = agency[order]
+
+        # Publish last: the unlocked fast path in load() keys off
+        # _schools_cache, so it must only become visible once every
+        # index above is in place
+        self._schools_cache = schools
+
         logger.info(f"✅ Loaded {len(schools)} schools from {self.source}")
         return schools
     
-    def _find_csv_file(self, csv_path: str) -> Optional[Path]:
-        """Find a CSV file, trying multiple possible locations"""
-        possible_paths = [
-            csv_path,
-            Path(__file__).parent / csv_path,
-            Path(__file__).parent / "data" / Path(csv_path).name,
-            f"data/{Path(csv_path).name}",
-            Path(csv_path).name,
-        ]
-        
-        for path in possible_paths:
-            p = Path(path)
-            if p.exists():
-                return p
-        
-        return None
-    
     def _load_and_merge_csvs(self) -> List[School]:
         """
         Load both CSV files and merge them on URN.
@@ -94,87 +329,185 @@ class DataLoader:
         2. Load Financial data
         3. Merge: GIAS provides base school info, Financial adds spending data
         """
+        # A partial refresh() may have staged a freshly merged frame
+        merged = self._merged_df
+        self._merged_df = None
+        if merged is None:
+            merged = self._read_merged_cache()
+        if merged is None:
+            # Steps 1+2: parse both CSVs in parallel - read_csv releases
+            # the GIL during I/O and tokenization, so wall time is the
+            # slower parse, not the sum
+            with ThreadPoolExecutor(max_workers=2) as ex:
+                f_gias = ex.submit(self._load_gias_csv)
+                f_fin = ex.submit(self._load_financial_csv)
+                gias_df = f_gias.result()
+                fin_df = f_fin.result()
+            logger.info(f"📖 Loaded {len(gias_df)} schools from GIAS")
+            logger.info(f"💰 Loaded {len(fin_df)} schools from Financial data")
+
+            # Keep the per-source frames for partial refresh
+            self._gias_df = gias_df
+            self._fin_df = fin_df
+            self._mtimes = self._csv_mtimes()
+
+            merged = self._merge_frames(gias_df, fin_df)
+            self._write_merged_cache(merged)
+
+        # Canonical names (no-op when the cache already stored them) and
+        # guaranteed presence of every consumed column
+        merged = merged.rename(columns=_CANONICAL_RENAMES)
+        for c in _ROW_COLUMNS:
+            if c not in merged.columns:
+                merged[c] = None
+
+        # Resolve multi-source fields once, vectorised - GIAS wins and
+        # the Financial side fills the gaps - instead of or-chains per row
+        merged['school_name'] = (
+            merged['school_name']
+            .combine_first(merged['school_name_fin'])
+            .combine_first(merged['school_name_gias'])
+        )
+        merged['la_name'] = (
+            merged['la_name']
+            .combine_first(merged['la_name_fin'])
+            .combine_first(merged['la_name_gias'])
+        )
+        merged['school_type'] = (
+            merged['school_type'].combine_first(merged['school_type_fin'])
+        )
+        pupils = merged['pupil_count'].combine_first(merged['total_pupils'])
+        merged['total_pupils'] = merged['total_pupils'].combine_first(merged['pupil_count'])
+        merged['pupil_count'] = pupils
+
+        self._df = merged
+
         schools = []
-        
-        # Step 1: Load GIAS data (contacts, addresses, etc.)
-        gias_data = self._load_gias_csv()
-        logger.info(f"📖 Loaded {len(gias_data)} schools from GIAS")
-        
-        # Step 2: Load Financial data
-        financial_data = self._load_financial_csv()
-        logger.info(f"💰 Loaded {len(financial_data)} schools from Financial data")
-        
-        # Step 3: Merge on URN
-        # Use GIAS as the base (it has better contact info)
-        # Add financial data where available
-        
-        all_urns = set(gias_data.keys()) | set(financial_data.keys())
-        logger.info(f"🔗 Merging {len(all_urns)} unique schools")
-        
-        for urn in all_urns:
-            gias = gias_data.get(urn, {})
-            fin = financial_data.get(urn, {})
-            
-            # Merge the two dictionaries (GIAS takes priority for contact info)
-            merged = {**fin, **gias}  # gias overwrites fin where both exist
-            
-            # But keep financial data for spending fields
-            if fin:
-                merged['_financial'] = fin
-            
+        # itertuples yields C-backed namedtuples - attribute access, no
+        # per-row dict allocation
+        for row in merged.itertuples(index=False):
             try:
-                school = self._merged_row_to_school(merged, urn)
+                school = self._merged_row_to_school(row)
                 if school:
                     schools.append(school)
             except Exception as e:
-                logger.warning(f"⚠️ Error creating school {urn}: {e}")
+                logger.warning(f"⚠️ Error creating school {row.urn}: {e}")
                 continue
-        
+
         return schools
-    
-    def _load_gias_csv(self) -> Dict[str, Dict]:
-        """Load GIAS CSV and return dict keyed by URN"""
-        gias_path = self._find_csv_file(CSV_FILE_PATH_GIAS)
-        
+
+    def _load_gias_csv(self) -> pd.DataFrame:
+        """Load GIAS CSV as a DataFrame with a normalized 'urn' column"""
+        gias_path = _find_csv_file(CSV_FILE_PATH_GIAS)
+
         if not gias_path:
             logger.warning(f"⚠️ GIAS CSV not found: {CSV_FILE_PATH_GIAS}")
-            return {}
-        
+            return pd.DataFrame(columns=['urn'])
+
         logger.info(f"📖 Reading GIAS from: {gias_path}")
-        
-        data = {}
-        with open(gias_path, 'r', encoding='utf-8-sig') as f:
-            reader = csv.DictReader(f)
-            for row in reader:
-                urn = self._clean_urn(row.get('urn') or row.get('URN'))
-                if urn:
-                    data[urn] = row
-        
-        return data
-    
-    def _load_financial_csv(self) -> Dict[str, Dict]:
-        """Load Financial CSV and return dict keyed by URN"""
-        fin_path = self._find_csv_file(CSV_FILE_PATH_FINANCIAL)
-        
+
+        df = pd.read_csv(gias_path, encoding='utf-8-sig')
+        df['urn'] = self._normalize_urn_column(df['urn'])
+        self._clean_string_columns(df, _GIAS_STRING_COLS)
+        if 'pupil_count' in df.columns:
+            df['pupil_count'] = pd.to_numeric(df['pupil_count'], errors='coerce')
+        if 'phone' in df.columns:
+            df['phone'] = self._clean_phone_column(df['phone'])
+        # Match the old dict semantics: drop rows without a URN, last wins
+        return df[df['urn'].notna()].drop_duplicates(subset='urn', keep='last')
+
+    def _load_financial_csv(self) -> pd.DataFrame:
+        """Load Financial CSV as a DataFrame with a normalized 'urn' column"""
+        fin_path = _find_csv_file(CSV_FILE_PATH_FINANCIAL)
+
         if not fin_path:
             logger.warning(f"⚠️ Financial CSV not found: {CSV_FILE_PATH_FINANCIAL}")
-            return {}
-        
+            return pd.DataFrame(columns=['urn'])
+
         logger.info(f"💰 Reading Financial data from: {fin_path}")
-        
-        data = {}
-        with open(fin_path, 'r', encoding='utf-8-sig') as f:
-            reader = csv.DictReader(f)
-            for row in reader:
-                # Skip failed rows
-                if row.get('status') and row.get('status') != 'success':
-                    continue
-                    
-                urn = self._clean_urn(row.get('URN') or row.get('urn'))
-                if urn:
-                    data[urn] = row
-        
-        return data
+
+        df = pd.read_csv(fin_path, encoding='utf-8-sig')
+
+        # Skip failed rows
+        if 'status' in df.columns:
+            df = df[df['status'].isna() | (df['status'] == 'success')]
+
+        # Coerce each spend column with one C loop instead of a _safe_float
+        # call per cell
+        for c in _FIN_NUMERIC_COLS:
+            if c in df.columns:
+                df[c] = pd.to_numeric(df[c], errors='coerce')
+        self._clean_string_columns(df, _FIN_STRING_COLS)
+
+        # The file carries both 'urn' and 'URN'; normalize into one column
+        urn = self._normalize_urn_column(df['URN'] if 'URN' in df.columns else df['urn'])
+        df = df.drop(columns=[c for c in ('URN', 'urn') if c in df.columns])
+        df['urn'] = urn
+        return df[df['urn'].notna()].drop_duplicates(subset='urn', keep='last')
+
+    def _normalize_urn_column(self, urns: pd.Series) -> pd.Series:
+        """Vectorized `_clean_urn` applied to a whole column at once"""
+        raw = urns.astype('string').str.strip().replace({'': pd.NA, 'nan': pd.NA})
+        numeric = pd.to_numeric(raw, errors='coerce')
+        return numeric.astype('Int64').astype('string').fillna(raw)
+
+    def _clean_string_columns(self, df: pd.DataFrame, cols) -> None:
+        """Strip string columns in bulk and blank out empty/'nan' cells"""
+        for c in cols:
+            if c in df.columns:
+                df[c] = (
+                    df[c].astype('string').str.strip()
+                    .replace({'': pd.NA, 'nan': pd.NA})
+                )
+
+    def _merge_frames(self, gias_df: pd.DataFrame, fin_df: pd.DataFrame) -> pd.DataFrame:
+        """Merge the two frames on URN with a single C-level hash join.
+
+        GIAS columns keep their plain names and win on collisions (it has
+        better contact info). NaN/NA becomes None so row handling matches
+        the old dict-based rows.
+        """
+        merged = gias_df.merge(fin_df, on='urn', how='outer', suffixes=('', '_fin'))
+        logger.info(f"🔗 Merging {len(merged)} unique schools")
+        return merged.astype(object).where(merged.notna(), None)
+
+    def _csv_mtimes(self) -> Dict[str, List[int]]:
+        """(mtime, size) of the source CSVs - the merged-cache signature.
+
+        Size guards against tools that rewrite a file but preserve its
+        mtime. Values are lists so the JSON round-trip compares equal.
+        """
+        mtimes = {}
+        for name, csv_path in (('gias', CSV_FILE_PATH_GIAS), ('fin', CSV_FILE_PATH_FINANCIAL)):
+            path = _find_csv_file(csv_path)
+            if path:
+                st = path.stat()
+                mtimes[name] = [st.st_mtime_ns, st.st_size]
+        return mtimes
+
+    def _read_merged_cache(self) -> Optional[pd.DataFrame]:
+        """Load the cached merged DataFrame if the CSVs haven't changed"""
+        try:
+            with open(_MERGED_CACHE_META, 'r') as f:
+                meta = json.load(f)
+            if meta != self._csv_mtimes():
+                return None
+            merged = pd.read_pickle(_MERGED_CACHE)
+        except Exception:
+            return None
+
+        logger.info(f"📦 Loaded {len(merged)} merged rows from cache")
+        return merged
+
+    def _write_merged_cache(self, merged: pd.DataFrame) -> None:
+        """Persist the merged DataFrame + source mtimes for the next boot"""
+        try:
+            _MERGED_CACHE.parent.mkdir(exist_ok=True)
+            merged.to_pickle(_MERGED_CACHE)
+            with open(_MERGED_CACHE_META, 'w') as f:
+                json.dump(self._csv_mtimes(), f)
+        except OSError as e:
+            logger.warning(f"⚠️ Could not write merged cache: {e}")
     
     def _clean_urn(self, urn) -> Optional[str]:
         """Clean and standardize URN format"""
@@ -185,93 +518,70 @@ class DataLoader:
         except (ValueError, TypeError):
             return str(urn).strip()
     
-    def _safe_float(self, value) -> Optional[float]:
-        """Safely convert a value to float"""
-        if value is None or value == '' or str(value).lower() == 'nan':
-            return None
-        try:
-            return float(value)
-        except (ValueError, TypeError):
-            return None
-    
-    def _safe_int(self, value) -> Optional[int]:
-        """Safely convert a value to int"""
-        if value is None or value == '' or str(value).lower() == 'nan':
-            return None
-        try:
-            return int(float(value))
-        except (ValueError, TypeError):
-            return None
-    
-    def _get_value(self, row: Dict[str, Any], *keys) -> Optional[str]:
-        """Get value from row, trying multiple possible column names"""
-        for key in keys:
-            value = row.get(key)
-            if value is not None and value != '' and str(value).lower() != 'nan':
-                return str(value).strip()
-        return None
-    
-    def _clean_phone(self, phone) -> Optional[str]:
-        """Clean phone number format"""
-        if phone is None:
-            return None
-        phone = str(phone).strip()
-        
+    def _clean_phone_column(self, phones: pd.Series) -> pd.Series:
+        """UK phone formatting over the whole column in C string ops"""
         # Remove .0 from float conversion
-        if phone.endswith('.0'):
-            phone = phone[:-2]
-        
-        # Format UK phone numbers
-        if phone.startswith('20') and len(phone) == 10:
-            phone = f"020 {phone[2:6]} {phone[6:]}"
-        elif phone.startswith('2') and len(phone) == 10:
-            phone = f"020 {phone[1:5]} {phone[5:]}"
-        
-        return phone if phone else None
+        phones = (
+            phones.astype('string').str.strip()
+            .str.replace(r'\.0$', '', regex=True)
+        )
+
+        # Format UK phone numbers: 20XXXXXXXX / 2XXXXXXXXX -> 020 XXXX XXXX
+        mask20 = phones.str.match(r'20\d{8}$', na=False)
+        mask2 = ~mask20 & phones.str.match(r'2\d{9}$', na=False)
+        phones = phones.mask(
+            mask20, '020 ' + phones.str.slice(2, 6) + ' ' + phones.str.slice(6)
+        )
+        phones = phones.mask(
+            mask2, '020 ' + phones.str.slice(1, 5) + ' ' + phones.str.slice(5)
+        )
+
+        return phones.replace({'': pd.NA, 'nan': pd.NA})
     
-    def _merged_row_to_school(self, row: Dict[str, Any], urn: str) -> Optional[School]:
+    def _merged_row_to_school(self, row) -> Optional[School]:
         """
         Convert a merged row (GIAS + Financial) to a School object.
+
+        `row` is an itertuples namedtuple over the canonical columns -
+        values are already coerced and stripped column-wise at load time,
+        so fields read straight off the attributes.
         """
-        # Get school name - prefer GIAS
-        school_name = self._get_value(
-            row, 
-            'school_name',      # GIAS
-            'SchoolName',       # Financial
-            'school_name_gias'
-        ) or f"School {urn}"
-        
-        # Get Local Authority name
-        la_name = self._get_value(
-            row, 
-            'la_name',          # GIAS
-            'LAName',           # Financial
-            'la_name_gias'
-        )
-        
-        # Get school type and phase - prefer GIAS
-        school_type = self._get_value(row, 'school_type', 'SchoolType')
-        phase = self._get_value(row, 'phase', 'Phase')
-        
-        # Get pupil count
-        pupil_count = self._safe_int(
-            row.get('pupil_count') or row.get('TotalPupils')
-        )
-        
-        # Get contact details from GIAS
-        phone = self._clean_phone(row.get('phone'))
-        website = self._get_value(row, 'website')
-        
+        urn = row.urn
+
+        # Multi-source fields were resolved column-wise after the merge
+        school_name = row.school_name or f"School {urn}"
+        la_name = row.la_name
+        school_type = row.school_type
+        phase = row.phase
+
+        # These fields have dozens of unique values across thousands of
+        # schools - intern so every repeat shares one string object
+        la_name = sys.intern(la_name) if la_name else None
+        school_type = sys.intern(school_type) if school_type else None
+        phase = sys.intern(phase) if phase else None
+
+        # Pupil count arrives as a coerced float - int it here since
+        # model_construct below skips the parse_pupil_count validator
+        pupil_count = row.pupil_count
+        if pupil_count is not None:
+            pupil_count = int(pupil_count)
+
+        # Get contact details from GIAS (phone was formatted at load time)
+        phone = row.phone
+        website = row.website
+
         # Build headteacher contact from GIAS data
         headteacher = None
-        head_title = self._get_value(row, 'head_title')
-        head_first = self._get_value(row, 'head_first_name')
-        head_last = self._get_value(row, 'head_last_name')
-        head_full = self._get_value(row, 'headteacher')
-        
+        head_title = row.head_title
+        head_first = row.head_first_name
+        head_last = row.head_last_name
+        head_full = row.headteacher
+
         if head_full or (head_first and head_last):
             full_name = head_full or f"{head_title or ''} {head_first or ''} {head_last or ''}".strip()
-            headteacher = Contact(
+            # Every input is already cleaned column-wise, so skip the
+            # validation pass on all three model constructions
+            headteacher = Contact.model_construct(
                 full_name=full_name,
                 role=ContactRole.HEADTEACHER,
                 title=head_title,
@@ -281,50 +591,33 @@ class DataLoader:
                 confidence_score=1.0
             )
         
-        # Build financial data from Financial CSV
-        fin = row.get('_financial', row)  # Use _financial if available, else row
-        
-        financial = FinancialData(
-            total_expenditure=self._safe_float(
-                fin.get('TotalExpenditure') or fin.get('total_expenditure')
-            ),
-            total_pupils=self._safe_float(
-                fin.get('TotalPupils') or row.get('pupil_count')
-            ),
-            total_teaching_support_costs=self._safe_float(
-                fin.get('TotalTeachingSupportStaffCosts') or fin.get('total_teaching_support_costs')
-            ),
-            teaching_staff_costs=self._safe_float(
-                fin.get('TeachingStaffCosts') or fin.get('teaching_staff_costs')
-            ),
-            supply_teaching_costs=self._safe_float(
-                fin.get('SupplyTeachingStaffCosts') or fin.get('supply_teaching_costs')
-            ),
-            agency_supply_costs=self._safe_float(
-                fin.get('AgencySupplyTeachingStaffCosts') or fin.get('agency_supply_costs')
-            ),
-            educational_support_costs=self._safe_float(
-                fin.get('EducationSupportStaffCosts') or fin.get('educational_support_costs')
-            ),
-            educational_consultancy_costs=self._safe_float(
-                fin.get('EducationalConsultancyCosts') or fin.get('educational_consultancy_costs')
-            ),
+        # Build financial data - the merge put the Financial CSV's columns
+        # straight onto the row, already coerced to floats
+        financial = FinancialData.model_construct(
+            total_expenditure=row.total_expenditure,
+            total_pupils=row.total_pupils,
+            total_teaching_support_costs=row.total_teaching_support_costs,
+            teaching_staff_costs=row.teaching_staff_costs,
+            supply_teaching_costs=row.supply_teaching_costs,
+            agency_supply_costs=row.agency_supply_costs,
+            educational_support_costs=row.educational_support_costs,
+            educational_consultancy_costs=row.educational_consultancy_costs,
         )
-        
+
         # Get address from GIAS
-        address_1 = self._get_value(row, 'address_1')
-        address_2 = self._get_value(row, 'address_2')
-        address_3 = self._get_value(row, 'address_3')
-        town = self._get_value(row, 'town')
-        county = self._get_value(row, 'county')
-        postcode = self._get_value(row, 'postcode')
-        
-        # Get trust info
-        trust_code = self._get_value(row, 'trust_code')
-        trust_name = self._get_value(row, 'trust_name')
+        address_1 = row.address_1
+        address_2 = row.address_2
+        address_3 = row.address_3
+        town = row.town
+        county = sys.intern(row.county) if row.county else None
+        postcode = row.postcode
+
+        # Get trust info (low-cardinality too - interned like la_name)
+        trust_code = sys.intern(row.trust_code) if row.trust_code else None
+        trust_name = sys.intern(row.trust_name) if row.trust_name else None
         
         # Create school object
-        school = School(
+        school = School.model_construct(
             urn=urn,
             school_name=school_name,
             la_name=la_name,
@@ -363,10 +656,10 @@ class DataLoader:
         """Get all schools from the data source."""
         return self.load()
     
-    def get_school_names(self) -> List[str]:
-        """Get list of all school names (for dropdown)."""
-        schools = self.load()
-        return sorted([s.school_name for s in schools])
+    def get_school_names(self) -> tuple:
+        """Get all school names, sorted (for dropdown). Shared tuple."""
+        self.load()
+        return self._sorted_names
     
     def get_school_by_name(self, name: str) -> Optional[School]:
         """Get a school by its name."""
@@ -383,18 +676,50 @@ class DataLoader:
     def search_schools(self, query: str) -> List[School]:
         """Search schools by name."""
         schools = self.load()
-        query_lower = query.lower()
-        return [s for s in schools if query_lower in s.school_name.lower()]
-    
+        if self._names_arr is None:
+            return []
+        # One C-level substring scan over the pre-lowercased name array
+        mask = np.char.find(self._names_arr, query.lower()) >= 0
+        return [schools[i] for i in np.flatnonzero(mask)]
+    
+    def search_school_names(self, query: str, limit: int = 20) -> List[str]:
+        """Names of schools matching `query`, case-insensitive.
+
+        Prefix matches resolve with an O(log N) bisect over the sorted
+        lowercase keys; only when the query prefixes nothing does it fall
+        back to the C-level substring scan search_schools uses.
+        """
+        schools = self.load()
+        if self._names_arr is None:
+            return []
+        q = query.lower()
+
+        i = bisect_left(self._prefix_keys, q)
+        matches = []
+        while i < len(self._prefix_keys) and len(matches) < limit \
+                and self._prefix_keys[i].startswith(q):
+            matches.append(self._prefix_names[i])
+            i += 1
+        if matches:
+            return matches
+
+        mask = np.char.find(self._names_arr, q) >= 0
+        return [schools[i].school_name for i in np.flatnonzero(mask)[:limit]]
+
     def get_schools_by_priority(self, priority: str) -> List[School]:
         """Get schools by sales priority level."""
-        schools = self.load()
-        return [s for s in schools if s.get_sales_priority() == priority]
-    
+        self.load()
+        return self._by_priority.get(priority, [])
+
+    def get_school_names_by_la(self, la_name: str) -> tuple:
+        """Sorted school names for one Local Authority. Shared tuple."""
+        self.load()
+        return self._names_by_la.get(la_name, ())
+
     def get_schools_by_borough(self, borough: str) -> List[School]:
         """Get schools by local authority/borough."""
-        schools = self.load()
-        return [s for s in schools if s.la_name and s.la_name.lower() == borough.lower()]
+        self.load()
+        return self._by_borough_lower.get(borough.lower(), [])
     
     def get_schools_with_staffing_spend(self, min_spend: float = 0) -> List[School]:
         """
@@ -404,11 +729,8 @@ class DataLoader:
             min_spend: Minimum total staffing spend to filter by
         """
         schools = self.load()
-        return [
-            s for s in schools 
-            if s.financial and s.financial.total_teaching_support_costs 
-            and s.financial.total_teaching_support_costs > min_spend
-        ]
+        # NaN compares False, so missing-spend schools fall out for free
+        return [schools[i] for i in np.flatnonzero(self._fin_total > min_spend)]
     
     def get_schools_with_agency_spend(self, min_spend: float = 0) -> List[School]:
         """
@@ -417,12 +739,11 @@ class DataLoader:
         Args:
             min_spend: Minimum agency spend to filter by (default 0 = any spend)
         """
-        schools = self.load()
-        return [
-            s for s in schools 
-            if s.financial and s.financial.agency_supply_costs 
-            and s.financial.agency_supply_costs > min_spend
-        ]
+        self.load()
+        # Keys are descending; searchsorted finds where spend stops
+        # exceeding min_spend
+        cutoff = int(np.searchsorted(-self._agency_sorted_keys, -min_spend, side='left'))
+        return self._agency_sorted[:cutoff]
     
     def get_top_spenders(self, limit: int = 20, spend_type: str = "total") -> List[School]:
         """
@@ -433,91 +754,133 @@ class DataLoader:
             spend_type: "total" for total staffing, "agency" for agency only
         """
         schools = self.load()
-        
-        if spend_type == "agency":
-            schools_with_spend = [s for s in schools if s.financial and s.financial.agency_supply_costs]
-            return sorted(
-                schools_with_spend,
-                key=lambda s: s.financial.agency_supply_costs or 0,
-                reverse=True
-            )[:limit]
-        else:
-            schools_with_spend = [s for s in schools if s.financial and s.financial.total_teaching_support_costs]
-            return sorted(
-                schools_with_spend,
-                key=lambda s: s.financial.total_teaching_support_costs or 0,
-                reverse=True
-            )[:limit]
+        arr = self._fin_agency if spend_type == "agency" else self._fin_total
+        return [schools[i] for i in self._top_k_indices(arr, limit)]
+
+    @staticmethod
+    def _top_k_indices(arr: np.ndarray, limit: int) -> np.ndarray:
+        """Indices of the top-K positive values of `arr`, descending.
+
+        argpartition keeps this O(N) - only the K survivors get sorted.
+        NaN (missing spend) maps to 0 and is dropped with the rest.
+        """
+        scores = np.nan_to_num(arr)
+        k = min(limit, len(scores))
+        if k == 0:
+            return np.array([], dtype=np.intp)
+        idx = np.argpartition(-scores, k - 1)[:k]
+        idx = idx[np.argsort(-scores[idx])]
+        return idx[scores[idx] > 0]
     
     def get_top_agency_spenders(self, limit: int = 20) -> List[School]:
         """Get schools with highest agency spend (backwards compatibility)."""
-        return self.get_top_spenders(limit=limit, spend_type="agency")
+        self.load()
+        return self._agency_sorted[:limit]
     
-    def get_boroughs(self) -> List[str]:
-        """Get list of all boroughs/Local Authorities in the data."""
-        schools = self.load()
-        boroughs = set(s.la_name for s in schools if s.la_name)
-        return sorted(list(boroughs))
+    def get_boroughs(self) -> tuple:
+        """Get all boroughs/Local Authorities, sorted. Shared tuple."""
+        self.load()
+        return self._sorted_boroughs
     
     def get_statistics(self) -> Dict[str, Any]:
         """Get summary statistics about the loaded data."""
         schools = self.load()
-        
-        # Calculate total staffing spend
-        total_staffing_spend = sum(
-            s.financial.total_teaching_support_costs or 0 
-            for s in schools 
-            if s.financial
-        )
-        
-        # Calculate total agency spend
-        total_agency_spend = sum(
-            s.financial.agency_supply_costs or 0 
-            for s in schools 
-            if s.financial
-        )
-        
-        # Count by priority
-        high = len([s for s in schools if s.get_sales_priority() == "HIGH"])
-        medium = len([s for s in schools if s.get_sales_priority() == "MEDIUM"])
-        low = len([s for s in schools if s.get_sales_priority() == "LOW"])
-        
-        # Count with contact details
-        with_contacts = len([s for s in schools if s.headteacher])
-        with_phone = len([s for s in schools if s.phone])
-        with_financial = len([s for s in schools if s.financial and s.financial.total_teaching_support_costs])
-        
+
+        # Spend totals and counts come straight off the SoA arrays
+        total_staffing_spend = float(np.nansum(self._fin_total))
+        total_agency_spend = float(np.nansum(self._fin_agency))
+
+        # Counts were bucketed once at load time
+        counts = self._priority_counts
+
+        # Count contact details in one fused pass over the objects
+        with_contacts = 0
+        with_phone = 0
+        for s in schools:
+            if s.headteacher:
+                with_contacts += 1
+            if s.phone:
+                with_phone += 1
+
         return {
             "total_schools": len(schools),
             "with_contacts": with_contacts,
             "with_phone": with_phone,
-            "with_financial_data": with_financial,
-            "with_agency_spend": len(self.get_schools_with_agency_spend()),
-            "total_staffing_spend": f"£{total_staffing_spend:,.0f}",
-            "total_agency_spend": f"£{total_agency_spend:,.0f}",
-            "high_priority": high,
-            "medium_priority": medium,
-            "low_priority": low,
-            "boroughs": len(self.get_boroughs()),
+            "with_financial_data": int(np.count_nonzero(self._fin_total > 0)),
+            "with_agency_spend": int(np.count_nonzero(self._fin_agency > 0)),
+            # Raw floats - formatting belongs to the presentation layer
+            "total_staffing_spend": total_staffing_spend,
+            "total_agency_spend": total_agency_spend,
+            "high_priority": counts.get("HIGH", 0),
+            "medium_priority": counts.get("MEDIUM", 0),
+            "low_priority": counts.get("LOW", 0),
+            "boroughs": len(self._by_borough),
             "data_source": self.source,
         }
     
-    def refresh(self) -> List[School]:
-        """Force reload data from source."""
+    def refresh(self, sources_changed_only: bool = False) -> List[School]:
+        """Force reload data from source.
+
+        With sources_changed_only=True, only the CSV whose mtime changed
+        is re-parsed; the retained frame for the other side is reused and
+        just the (cheap) merge is redone.
+        """
+        if sources_changed_only and self._gias_df is not None and self._fin_df is not None:
+            current = self._csv_mtimes()
+            if current == self._mtimes:
+                return self.load()
+            if current.get('gias') != self._mtimes.get('gias'):
+                self._gias_df = self._load_gias_csv()
+            if current.get('fin') != self._mtimes.get('fin'):
+                self._fin_df = self._load_financial_csv()
+            self._mtimes = current
+            self._merged_df = self._merge_frames(self._gias_df, self._fin_df)
+            self._write_merged_cache(self._merged_df)
+        else:
+            _MERGED_CACHE.unlink(missing_ok=True)
+            _MERGED_CACHE_META.unlink(missing_ok=True)
+            self._gias_df = None
+            self._fin_df = None
+            self._merged_df = None
         self._schools_cache = None
         self._schools_by_name = {}
         self._schools_by_urn = {}
+        self._fin_total = None
+        self._fin_agency = None
+        self._pupils = None
+        self._agency_per_pupil = None
+        self._priority = None
+        self._by_priority = {}
+        self._by_borough = {}
+        self._by_borough_lower = {}
+        self._priority_counts = {}
+        self._sorted_names = ()
+        self._sorted_boroughs = ()
+        self._names_by_la = {}
+        self._names_lower = []
+        self._names_arr = None
+        self._prefix_keys = []
+        self._prefix_names = []
+        self._agency_sorted = []
+        self._agency_sorted_keys = None
         return self.load()
 
 
 # Singleton instance
 _loader_instance: Optional[DataLoader] = None
+_loader_lock = threading.Lock()
 
 def get_data_loader() -> DataLoader:
-    """Get the global DataLoader instance."""
+    """Get the global DataLoader instance (thread-safe)."""
     global _loader_instance
     if _loader_instance is None:
-        _loader_instance = DataLoader()
+        with _loader_lock:
+            if _loader_instance is None:
+                loader = DataLoader()
+                # Warm the cache off the calling thread; early callers
+                # just block in load() until it finishes
+                threading.Thread(target=loader.load, daemon=True).start()
+                _loader_instance = loader
     return _loader_instance
 
 
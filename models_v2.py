@@ -5,7 +5,7 @@ UPDATED: Priority now based on TOTAL STAFFING SPEND (not just agency)
 Because Protocol Education offers permanent, temporary, AND agency staff
 """
 
-from pydantic import BaseModel, Field, field_validator
+from pydantic import BaseModel, Field, PrivateAttr, field_validator
 from typing import Optional, List, Dict, Any
 from datetime import datetime
 from enum import Enum
@@ -274,33 +274,64 @@ class School(BaseModel):
             v = v[:-2]
         return v
     
+    _full_address: Optional[str] = PrivateAttr(default=None)
+
     def get_full_address(self) -> str:
-        """Combine address fields into single string"""
-        parts = [
-            self.address_1, 
-            self.address_2, 
-            self.address_3, 
-            self.town, 
-            self.county, 
-            self.postcode
-        ]
-        return ", ".join([p for p in parts if p])
+        """Combine address fields into single string (memoized)"""
+        if self._full_address is None:
+            parts = [
+                self.address_1,
+                self.address_2,
+                self.address_3,
+                self.town,
+                self.county,
+                self.postcode
+            ]
+            self._full_address = ", ".join([p for p in parts if p])
+        return self._full_address
     
+    # Computed at most once per School - get_statistics and the priority
+    # buckets would otherwise re-derive it several times per object
+    _sales_priority: Optional[str] = PrivateAttr(default=None)
+
     def get_sales_priority(self) -> str:
-        """Determine sales priority based on financial data"""
-        if not self.financial:
-            return "UNKNOWN"
-        return self.financial.get_priority_level()
+        """Determine sales priority based on financial data (memoized)"""
+        priority = self._sales_priority
+        if priority is None:
+            if not self.financial:
+                priority = "UNKNOWN"
+            else:
+                priority = self.financial.get_priority_level()
+            self._sales_priority = priority
+        return priority
     
     def has_contact_details(self) -> bool:
         """Check if we have headteacher contact details"""
         return self.headteacher is not None
+
+    def to_json(self) -> str:
+        """
+        Serialize the school (with nested contact/financial data) to JSON.
+        Uses Pydantic v2's Rust-backed serializer, which is much faster
+        than model_dump() + json.dumps().
+        """
+        return self.model_dump_json(exclude_none=True)
     
+    # (ofsted, text) pair - the ofsted payload is the only field attached
+    # after load that changes the rendered context, and holding the object
+    # itself lets an identity check tell whether it was swapped
+    _llm_context_cache: Optional[tuple] = PrivateAttr(default=None)
+
     def to_llm_context(self) -> str:
         """
         Convert school data to text format for LLM analysis.
-        Includes both contact and financial data.
+        Includes both contact and financial data. Memoized - the chains
+        render the same school several times per request.
         """
+        cached = self._llm_context_cache
+        if cached is not None and cached[0] is self.ofsted:
+            return cached[1]
+
         lines = [
             f"SCHOOL: {self.school_name}",
             f"URN: {self.urn}",
@@ -343,8 +374,10 @@ class School(BaseModel):
                 lines.append("Areas for improvement:")
                 for area in self.ofsted.areas_for_improvement:
                     lines.append(f"  - {area}")
-        
-        return "\n".join(lines)
+
+        context = "\n".join(lines)
+        self._llm_context_cache = (self.ofsted, context)
+        return context
 
 
 class SchoolSearchResult(BaseModel):
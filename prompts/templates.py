@@ -5,68 +5,60 @@ UPDATED: Now focuses on TOTAL STAFFING SPEND (not just agency)
 Because Protocol Education offers permanent, temporary, AND agency staff
 """
 
+import sys
+from functools import lru_cache
+from typing import Final
+
 from langchain_core.prompts import ChatPromptTemplate, MessagesPlaceholder
 
+from config_v2 import LLM_PROVIDER
+
+
+def _cacheable_system(text: str):
+    """
+    Wrap a static system prompt so the provider can serve it from its
+    prompt cache. Anthropic needs an explicit cache_control marker on the
+    content block; OpenAI caches any byte-identical prefix automatically,
+    so plain text is already optimal there. The system strings below must
+    stay static (no per-call timestamps/names) for the cache to hit.
+    """
+    if LLM_PROVIDER == "anthropic":
+        return [{"type": "text", "text": text, "cache_control": {"type": "ephemeral"}}]
+    return text
+
 
 # =============================================================================
 # CONVERSATION STARTERS PROMPT (UPDATED FOR TOTAL STAFFING)
 # =============================================================================
 
-CONVERSATION_STARTERS_SYSTEM = """You are an expert sales coach for Protocol Education (part of Supporting Education Group), a leading education recruitment company in the UK.
-
-Your job is to analyze school data and generate compelling, personalized conversation starters that help recruitment consultants make effective sales calls.
-
-CONTEXT ABOUT THE BUSINESS:
-- Protocol Education provides THREE types of staffing to UK schools:
-  1. PERMANENT staff recruitment (teachers, leaders, support staff)
-  2. TEMPORARY staff (short-term cover, maternity cover, etc.)
-  3. AGENCY/SUPPLY staff (day-to-day cover)
-- Our consultants call schools to offer ALL of these staffing solutions
-- We compete against agencies like Zen Educate, Hays, and others
-
-UNDERSTANDING THE FINANCIAL DATA:
-- You will see TOTAL STAFFING SPEND values (e.g., "Total Staffing Costs: £2,500,000")
-- These are annual figures from the government's Financial Benchmarking Tool
-- Higher total staffing spend = bigger school = bigger opportunity for ALL our services
-- Schools spending £500k+ on total staffing are HIGH priority
-- Schools spending £200k-500k are MEDIUM priority
-- Agency spend is just ONE indicator - don't focus only on agency
-
-YOUR CONVERSATION STARTERS SHOULD:
-1. Reference SPECIFIC data from the school (actual £ amounts, headteacher names, school details)
-2. Be natural and conversational - not salesy or pushy
-3. Offer value and understanding before asking for anything
-4. Cover ALL our services - permanent, temporary, AND agency staffing
-5. Be between 2-4 sentences each
-6. Include the headteacher's name when available
-
-PRIORITY ORDER FOR TOPICS:
-1. Total staffing budget (big spenders need more staff - permanent and temporary)
-2. School size and pupil count (larger schools = more staffing needs)
-3. Any agency spend (opportunity to discuss our agency services specifically)
-4. Recent Ofsted challenges or improvement areas (may need specialist staff)
-5. School type and phase (different needs for primary vs secondary)
-6. General relationship building based on local authority
-
-DO NOT:
-- Focus ONLY on agency spend - we offer much more than that
-- Be generic or use templates that could apply to any school
-- Mention competitors negatively
-- Make promises we can't keep
-- Be overly pushy or aggressive"""
-
-
-CONVERSATION_STARTERS_HUMAN = """Analyze this school data and generate {num_starters} personalized conversation starters.
+CONVERSATION_STARTERS_SYSTEM: Final[str] = sys.intern("""You are an expert sales coach for Protocol Education (part of Supporting Education Group), a UK education recruitment company.
 
-{school_context}
+Analyze school data and generate personalized conversation starters for recruitment consultants' sales calls.
+
+BUSINESS CONTEXT:
+- Services: PERMANENT recruitment (teachers, leaders, support staff), TEMPORARY staff (maternity/short-term cover), AGENCY/SUPPLY staff (day-to-day cover)
+- Consultants offer ALL three; competitors include Zen Educate and Hays
+
+FINANCIAL DATA (annual totals from the government's Financial Benchmarking Tool):
+- TOTAL STAFFING SPEND is the key metric: £500k+ = HIGH priority, £200k-500k = MEDIUM
+- Bigger spend = bigger school = bigger opportunity for ALL services
+- Agency spend is just one indicator - never the sole focus
+
+EACH STARTER MUST:
+- Reference SPECIFIC data (actual £ amounts, headteacher name, school details)
+- Be natural and conversational, 2-4 sentences, value-first - not salesy or pushy
+- Cover a mix of our services, not just agency
+
+TOPIC PRIORITY: total staffing budget > pupil count/size > agency spend > Ofsted improvement areas > school type/phase > local authority rapport
+
+DO NOT: be generic, mention competitors negatively, make promises we can't keep, or be pushy.""")
 
-Generate conversation starters that reference the specific data above. Each starter should feel personal to THIS school, not generic.
 
-IMPORTANT: 
-- Use actual pound amounts (e.g., "I noticed you invest over £2 million in staffing")
-- Use the headteacher's name if available
-- Cover a MIX of our services (permanent, temporary, agency) - not just agency
-- Mention specific details about the school
+CONVERSATION_STARTERS_HUMAN: Final[str] = sys.intern("""Analyze this school data and generate {num_starters} personalized conversation starters.
+
+{school_context}
+
+Each starter must feel personal to THIS school: use actual pound amounts (e.g., "I noticed you invest over £2 million in staffing"), use the headteacher's name if available, and cover a MIX of our services - not just agency.
 
 Return your response as JSON with this exact structure:
 {{
@@ -80,13 +72,14 @@ Return your response as JSON with this exact structure:
     ],
     "summary": "One sentence summary of this school's key characteristics",
     "sales_priority": "HIGH, MEDIUM, or LOW"
-}}"""
+}}""")
 
 
+@lru_cache(maxsize=None)
 def get_conversation_starters_prompt() -> ChatPromptTemplate:
     """Create the main conversation starters prompt template."""
     return ChatPromptTemplate.from_messages([
-        ("system", CONVERSATION_STARTERS_SYSTEM),
+        ("system", _cacheable_system(CONVERSATION_STARTERS_SYSTEM)),
         ("human", CONVERSATION_STARTERS_HUMAN),
     ])
 
@@ -95,29 +88,18 @@ def get_conversation_starters_prompt() -> ChatPromptTemplate:
 # FINANCIAL ANALYSIS PROMPT (UPDATED FOR ALL STAFFING)
 # =============================================================================
 
-FINANCIAL_ANALYSIS_SYSTEM = """You are a financial analyst specializing in UK school budgets and staffing costs.
+FINANCIAL_ANALYSIS_SYSTEM: Final[str] = sys.intern("""You are a financial analyst specializing in UK school budgets and staffing costs.
 
-Your job is to analyze school financial data from the government's Financial Benchmarking and Insights Tool (FBIT) and identify opportunities where Protocol Education's recruitment services could help.
+Analyze school financial data from the government's Financial Benchmarking and Insights Tool (FBIT) and identify where Protocol Education's services (permanent recruitment, temporary staffing, agency/supply cover) could help.
 
-Protocol Education offers:
-- Permanent recruitment (teachers, leaders, support staff)
-- Temporary staffing (maternity cover, long-term supply)
-- Agency/supply staff (day-to-day cover)
+KEY METRICS (all total annual spend):
+- Total staffing costs - THE key metric
+- Teaching staff (E01), supply teaching (E02), agency supply (E26), educational support/TAs (E03)
 
-KEY METRICS TO FOCUS ON (all in TOTAL ANNUAL SPEND):
-- Total staffing costs: Overall investment in staff - THIS IS THE KEY METRIC
-- Teaching staff costs (E01): Main teaching staff investment
-- Supply teaching costs (E02): Temporary cover spending
-- Agency supply costs (E26): Agency staff specifically
-- Educational support costs (E03): TAs, support staff
+PROSPECT TIERS: £500,000+ total staffing = HIGH PRIORITY; £200,000-500,000 = MEDIUM; any staffing budget = potential client.""")
 
-WHAT MAKES A SCHOOL A GOOD PROSPECT:
-- £500,000+ total staffing = HIGH PRIORITY (large school, lots of hiring)
-- £200,000-500,000 = MEDIUM PRIORITY
-- Any school with staffing budget is a potential client for our services"""
 
-
-FINANCIAL_ANALYSIS_HUMAN = """Analyze this school's financial data and explain the key insights for a sales call:
+FINANCIAL_ANALYSIS_HUMAN: Final[str] = sys.intern("""Analyze this school's financial data and explain the key insights for a sales call:
 
 School: {school_name}
 Financial Data:
@@ -126,13 +108,14 @@ Financial Data:
 Provide:
 1. Key financial insight (1-2 sentences) - reference actual £ amounts
 2. Which of our services might be most relevant (permanent, temporary, or agency)
-3. A specific question to ask the school about their staffing needs"""
+3. A specific question to ask the school about their staffing needs""")
 
 
+@lru_cache(maxsize=None)
 def get_financial_analysis_prompt() -> ChatPromptTemplate:
     """Create financial analysis prompt template"""
     return ChatPromptTemplate.from_messages([
-        ("system", FINANCIAL_ANALYSIS_SYSTEM),
+        ("system", _cacheable_system(FINANCIAL_ANALYSIS_SYSTEM)),
         ("human", FINANCIAL_ANALYSIS_HUMAN),
     ])
 
@@ -141,19 +124,17 @@ def get_financial_analysis_prompt() -> ChatPromptTemplate:
 # OFSTED ANALYSIS PROMPT (unchanged)
 # =============================================================================
 
-OFSTED_ANALYSIS_SYSTEM = """You are an Ofsted specialist who understands how inspection reports relate to school staffing needs.
-
-Your job is to identify improvement areas from Ofsted that could be addressed through better staffing:
-- Teaching quality issues → need for specialist teachers or quality supply staff
-- Leadership gaps → need for interim leaders or permanent leadership recruitment
-- Subject-specific weaknesses → need for subject specialists (permanent or temporary)
-- SEND provision issues → need for SENCO support or trained TAs
+OFSTED_ANALYSIS_SYSTEM: Final[str] = sys.intern("""You are an Ofsted specialist mapping inspection findings to staffing needs:
+- Teaching quality issues → specialist teachers or quality supply staff
+- Leadership gaps → interim or permanent leadership recruitment
+- Subject-specific weaknesses → subject specialists (permanent or temporary)
+- SEND provision issues → SENCO support or trained TAs
 - Behaviour/attendance → often linked to staffing consistency
 
-Schools under "Requires Improvement" or with recent inspections are especially likely to be actively recruiting."""
+Schools under "Requires Improvement" or with recent inspections are especially likely to be actively recruiting.""")
 
 
-OFSTED_ANALYSIS_HUMAN = """Analyze this Ofsted data for staffing-related opportunities:
+OFSTED_ANALYSIS_HUMAN: Final[str] = sys.intern("""Analyze this Ofsted data for staffing-related opportunities:
 
 School: {school_name}
 Ofsted Rating: {rating}
@@ -163,13 +144,14 @@ Areas for Improvement: {areas_for_improvement}
 Identify:
 1. Which improvement areas could be addressed through staffing
 2. What type of staff would help (permanent teachers, temporary cover, specialists, TAs, etc.)
-3. A conversation opener that shows we understand their Ofsted journey"""
+3. A conversation opener that shows we understand their Ofsted journey""")
 
 
+@lru_cache(maxsize=None)
 def get_ofsted_analysis_prompt() -> ChatPromptTemplate:
     """Create Ofsted analysis prompt template"""
     return ChatPromptTemplate.from_messages([
-        ("system", OFSTED_ANALYSIS_SYSTEM),
+        ("system", _cacheable_system(OFSTED_ANALYSIS_SYSTEM)),
         ("human", OFSTED_ANALYSIS_HUMAN),
     ])
 
@@ -178,29 +160,114 @@ def get_ofsted_analysis_prompt() -> ChatPromptTemplate:
 # QUICK SUMMARY PROMPT (UPDATED)
 # =============================================================================
 
-QUICK_SUMMARY_SYSTEM = """You are a research assistant. Your job is to create brief, factual summaries of schools for sales consultants to quickly understand who they're calling.
+QUICK_SUMMARY_SYSTEM: Final[str] = sys.intern("""You are a research assistant writing brief, factual school summaries so sales consultants know who they're calling. Lead with total staffing spend, include the headteacher's name if available, 2-3 sentences maximum.""")
 
-When you see financial data, mention the KEY figures:
-- Total staffing spend is most important
-- Keep it to 2-3 sentences maximum
-- Include headteacher name if available"""
 
-
-QUICK_SUMMARY_HUMAN = """Create a 2-sentence summary of this school:
+QUICK_SUMMARY_HUMAN: Final[str] = sys.intern("""Create a 2-sentence summary of this school:
 
 {school_context}
 
-Focus on: school type, size, headteacher name, total staffing budget, and any notable Ofsted factors."""
+Focus on: school type, size, headteacher name, total staffing budget, and any notable Ofsted factors.""")
 
 
+@lru_cache(maxsize=None)
 def get_quick_summary_prompt() -> ChatPromptTemplate:
     """Create quick summary prompt template"""
     return ChatPromptTemplate.from_messages([
-        ("system", QUICK_SUMMARY_SYSTEM),
+        ("system", _cacheable_system(QUICK_SUMMARY_SYSTEM)),
         ("human", QUICK_SUMMARY_HUMAN),
     ])
 
 
+# =============================================================================
+# COMBINED ANALYSIS PROMPT (one call instead of four)
+# =============================================================================
+# Fuses the four analyses above into a single request: one network round
+# trip and one pass over the school context instead of four, so "Generate
+# Insights" pays max(latency) rather than the sum.
+
+COMBINED_ANALYSIS_SYSTEM: Final[str] = sys.intern(
+    "You are four specialists in one for Protocol Education. Apply each role "
+    "to the school data you are given.\n\n"
+    "## Role 1: Sales Coach\n" + CONVERSATION_STARTERS_SYSTEM +
+    "\n\n## Role 2: Financial Analyst\n" + FINANCIAL_ANALYSIS_SYSTEM +
+    "\n\n## Role 3: Ofsted Specialist\n" + OFSTED_ANALYSIS_SYSTEM +
+    "\n\n## Role 4: Research Assistant\n" + QUICK_SUMMARY_SYSTEM
+)
+
+
+COMBINED_ANALYSIS_HUMAN: Final[str] = sys.intern("""Analyze this school data and generate {num_starters} personalized conversation starters plus supporting analysis.
+
+{school_context}
+
+Return your response as JSON with this exact structure:
+{{
+    "conversation_starters": [
+        {{
+            "topic": "Brief topic (3-5 words)",
+            "detail": "The full conversation starter (2-4 sentences)",
+            "source": "What data this is based on",
+            "relevance_score": 0.0 to 1.0
+        }}
+    ],
+    "financial_insight": "Key financial insight referencing actual £ amounts, or null if no financial data",
+    "ofsted_insight": "Staffing-related Ofsted opportunity, or null if no Ofsted data",
+    "summary": "One sentence summary of this school's key characteristics",
+    "sales_priority": "HIGH, MEDIUM, or LOW"
+}}""")
+
+
+@lru_cache(maxsize=None)
+def get_combined_school_analysis_prompt() -> ChatPromptTemplate:
+    """Create the fused four-in-one analysis prompt template."""
+    return ChatPromptTemplate.from_messages([
+        ("system", _cacheable_system(COMBINED_ANALYSIS_SYSTEM)),
+        ("human", COMBINED_ANALYSIS_HUMAN),
+    ])
+
+
+# =============================================================================
+# OFSTED + FINANCIAL FUSED STARTERS (one call instead of two)
+# =============================================================================
+# The with-Ofsted flow used to pay two LLM round trips: one to analyze
+# the report, one for financial starters, then interleave the results in
+# Python. This prompt feeds the raw report excerpt alongside the school
+# context and asks for the mixed set directly.
+
+OFSTED_COMBINED_HUMAN: Final[str] = sys.intern("""Analyze this school data plus its latest Ofsted report and generate {num_starters} personalized conversation starters. Draw roughly 60% from the Ofsted findings (staffing-related opportunities) and the rest from the financial data.
+
+{school_context}
+
+OFSTED REPORT (rating: {rating}, inspected: {inspection_date}):
+{ofsted_excerpt}
+
+For starters drawn from the Ofsted report, set "source" to exactly this URL: {report_url}
+For the rest, describe the data they are based on.
+
+Return your response as JSON with this exact structure:
+{{
+    "conversation_starters": [
+        {{
+            "topic": "Brief topic (3-5 words)",
+            "detail": "The full conversation starter (2-4 sentences)",
+            "source": "Ofsted report URL or data description",
+            "relevance_score": 0.0 to 1.0
+        }}
+    ],
+    "summary": "One sentence summary of this school's key characteristics",
+    "sales_priority": "HIGH, MEDIUM, or LOW"
+}}""")
+
+
+@lru_cache(maxsize=None)
+def get_ofsted_combined_prompt() -> ChatPromptTemplate:
+    """Create the fused Ofsted + financial starters prompt template."""
+    return ChatPromptTemplate.from_messages([
+        ("system", _cacheable_system(CONVERSATION_STARTERS_SYSTEM)),
+        ("human", OFSTED_COMBINED_HUMAN),
+    ])
+
+
 # =============================================================================
 # JSON SCHEMA FOR OUTPUT PARSING
 # =============================================================================
@@ -226,3 +293,15 @@ CONVERSATION_STARTER_SCHEMA = {
     },
     "required": ["conversation_starters", "sales_priority"]
 }
+
+
+# Superset of CONVERSATION_STARTER_SCHEMA for the combined prompt
+COMBINED_ANALYSIS_SCHEMA = {
+    "type": "object",
+    "properties": {
+        **CONVERSATION_STARTER_SCHEMA["properties"],
+        "financial_insight": {"type": ["string", "null"], "description": "Key financial insight"},
+        "ofsted_insight": {"type": ["string", "null"], "description": "Staffing-related Ofsted opportunity"},
+    },
+    "required": ["conversation_starters", "sales_priority"]
+}
@@ -8,11 +8,13 @@ WHAT THIS FILE DOES:
 - Handles caching to avoid redundant LLM calls
 """
 
+import asyncio
 import logging
 import json
-import hashlib
 import sys
 import os
+import threading
+from concurrent.futures import Future
 from pathlib import Path
 from datetime import datetime, timedelta
 from typing import Optional, List, Dict, Any
@@ -27,16 +29,40 @@ if str(PROJECT_ROOT) not in sys.path:
 
 from models_v2 import School, ConversationStarter, ConversationStarterResponse
 from data_loader import DataLoader, get_data_loader
-from chains.conversation_chain import ConversationChain
 from config_v2 import ENABLE_CACHE, CACHE_TTL_HOURS, CACHE_DIR, FEATURES
 
-# Import Ofsted chain (optional - may fail if dependencies missing)
-try:
-    from chains.ofsted_chain import OfstedChain, get_ofsted_chain
-    OFSTED_AVAILABLE = True
-except ImportError as e:
-    OFSTED_AVAILABLE = False
-    logger.warning(f"Ofsted chain not available: {e}")
+# The LangChain-backed chains are heavy imports and the Ofsted one may be
+# missing its optional dependencies - both resolve lazily on first use so
+# importing this module stays cheap for the Streamlit cold start.
+_OFSTED_FACTORY = None
+_OFSTED_CHECKED = False
+
+
+def _ofsted_available() -> bool:
+    """Import the Ofsted chain on first use; remember the outcome."""
+    global _OFSTED_FACTORY, _OFSTED_CHECKED
+    if not _OFSTED_CHECKED:
+        _OFSTED_CHECKED = True
+        try:
+            from chains.ofsted_chain import get_ofsted_chain
+            _OFSTED_FACTORY = get_ofsted_chain
+        except ImportError as e:
+            logger.warning(f"Ofsted chain not available: {e}")
+    return _OFSTED_FACTORY is not None
+
+# LangChain exact-match LLM response cache (optional - langchain_community
+# may be missing on some deploys). Complements SimpleCache: SimpleCache
+# skips the chain entirely for a cached school, while this catches any
+# repeat of an identical rendered prompt across Streamlit reruns.
+if ENABLE_CACHE:
+    try:
+        from langchain_community.cache import SQLiteCache
+        from langchain_core.globals import set_llm_cache
+
+        set_llm_cache(SQLiteCache(database_path=str(PROJECT_ROOT / ".llm_cache.db")))
+        logger.info("✅ LLM response cache enabled (.llm_cache.db)")
+    except ImportError as e:
+        logger.warning(f"⚠️ LLM response cache not available: {e}")
 
 
 class SimpleCache:
@@ -55,10 +81,35 @@ class SimpleCache:
         self.cache_dir = Path(cache_dir)
         self.cache_dir.mkdir(exist_ok=True)
         self.enabled = ENABLE_CACHE
-        
+        # In-memory mirror of the cache files: urn -> (cached_at, starters).
+        # Disk is write-through only, so the hit path is a dict lookup
+        # instead of stat + open + json.load per click. Bounded by the
+        # school count (~3k), so no eviction needed.
+        self._mem: Dict[str, tuple] = {}
+        if self.enabled:
+            self._preload()
+
+    def _preload(self) -> None:
+        """Parse every cache file once at init (covers legacy MD5 names too)."""
+        for path in self.cache_dir.glob("*.json"):
+            try:
+                with open(path, 'r') as f:
+                    data = json.load(f)
+                cached_at = datetime.fromisoformat(data['cached_at'])
+                self._mem[str(data['school_urn'])] = (cached_at, data['starters'])
+            except Exception:
+                continue  # unrelated or corrupt file - treat as a miss
+        if self._mem:
+            logger.info(f"📦 Preloaded {len(self._mem)} cached starter sets")
+
     def _get_cache_key(self, school_urn: str) -> str:
-        """Generate cache key from school URN"""
-        return hashlib.md5(f"starters_{school_urn}".encode()).hexdigest()
+        """Generate cache key from school URN.
+
+        URNs are short filesystem-safe integers, so the key is used
+        directly - hashing added MD5 overhead per lookup and made cache
+        files impossible to identify by eye.
+        """
+        return f"starters_{school_urn}"
     
     def _get_cache_path(self, key: str) -> Path:
         return self.cache_dir / f"{key}.json"
@@ -68,28 +119,18 @@ class SimpleCache:
         if not self.enabled:
             return None
             
-        key = self._get_cache_key(school_urn)
-        cache_path = self._get_cache_path(key)
-        
-        if not cache_path.exists():
+        entry = self._mem.get(str(school_urn))
+        if entry is None:
             return None
-        
-        try:
-            with open(cache_path, 'r') as f:
-                data = json.load(f)
-            
-            # Check if expired
-            cached_at = datetime.fromisoformat(data['cached_at'])
-            if datetime.now() - cached_at > timedelta(hours=CACHE_TTL_HOURS):
-                logger.info(f" Cache expired for {school_urn}")
-                return None
-            
-            logger.info(f"📦 Cache HIT for {school_urn}")
-            return data['starters']
-            
-        except Exception as e:
-            logger.warning(f"⚠️ Cache read error: {e}")
+
+        cached_at, starters = entry
+        if datetime.now() - cached_at > timedelta(hours=CACHE_TTL_HOURS):
+            logger.info(f" Cache expired for {school_urn}")
+            self._mem.pop(str(school_urn), None)
             return None
+
+        logger.info(f"📦 Cache HIT for {school_urn}")
+        return starters
     
     def set(self, school_urn: str, starters: List[ConversationStarter]) -> bool:
         """Save conversation starters to cache"""
@@ -100,15 +141,21 @@ class SimpleCache:
         cache_path = self._get_cache_path(key)
         
         try:
+            cached_at = datetime.now()
             data = {
                 'school_urn': school_urn,
-                'cached_at': datetime.now().isoformat(),
+                'cached_at': cached_at.isoformat(),
                 'starters': [s.model_dump() for s in starters]
             }
-            
+
             with open(cache_path, 'w') as f:
-                json.dump(data, f, indent=2)
-            
+                # Compact separators, no indent - the pretty-printer is
+                # stdlib json's slowest mode and nobody reads these files
+                json.dump(data, f, separators=(',', ':'))
+
+            # Write-through to the in-memory mirror
+            self._mem[str(school_urn)] = (cached_at, data['starters'])
+
             logger.info(f" Cached {len(starters)} starters for {school_urn}")
             return True
             
@@ -126,15 +173,83 @@ class SimpleCache:
             if cache_path.exists():
                 cache_path.unlink()
                 count = 1
+            self._mem.pop(str(school_urn), None)
         else:
-            for cache_file in self.cache_dir.glob("*.json"):
-                cache_file.unlink()
-                count += 1
+            # os.scandir + os.unlink skips pathlib's per-entry Path
+            # allocation and re-stat - matters with thousands of cached
+            # schools. Catches legacy MD5-named files too.
+            with os.scandir(self.cache_dir) as entries:
+                for entry in entries:
+                    if entry.name.endswith(".json"):
+                        os.unlink(entry.path)
+                        count += 1
+            self._mem.clear()
         
         logger.info(f" Cleared {count} cache entries")
         return count
 
 
+class SemanticCache:
+    """
+    Near-duplicate cache keyed on school characteristics, not URN.
+
+    Two schools with near-identical spend profile, size, phase and LA get
+    near-identical starters from the LLM anyway, so when similarity is
+    high enough we reuse the cached set instead of paying for a new call.
+    Embeds structured features into a small normalized vector and matches
+    with one cosine pass (a numpy matrix-vector product).
+
+    Opt-in via FEATURES["semantic_cache"]: reused starters can cite the
+    donor school's specifics, which suits quick triage over polish.
+    """
+
+    SIMILARITY_THRESHOLD = 0.95
+
+    def __init__(self):
+        self._urns: List[str] = []
+        self._matrix = None  # np.ndarray[N, D], rows L2-normalized
+
+    @staticmethod
+    def _embed(school: School):
+        import numpy as np
+        import math
+        import zlib
+
+        fin = school.financial
+        total = float((fin.total_teaching_support_costs if fin else 0) or 0)
+        agency = float((fin.agency_supply_costs if fin else 0) or 0)
+        pupils = float((fin.total_pupils if fin else 0) or 0)
+        # crc32 buckets keep categorical features deterministic across runs
+        phase_h = (zlib.crc32((school.phase or "").encode()) % 1000) / 1000.0
+        la_h = (zlib.crc32((school.la_name or "").encode()) % 1000) / 1000.0
+
+        vec = np.array(
+            [math.log1p(total), math.log1p(agency), math.log1p(pupils),
+             phase_h * 5.0, la_h * 5.0],
+            dtype=np.float32,
+        )
+        norm = float(np.linalg.norm(vec))
+        return vec / norm if norm else vec
+
+    def lookup(self, school: School) -> Optional[str]:
+        """URN of a sufficiently similar school, or None."""
+        if self._matrix is None:
+            return None
+        import numpy as np
+        sims = self._matrix @ self._embed(school)
+        best = int(np.argmax(sims))
+        if sims[best] > self.SIMILARITY_THRESHOLD:
+            logger.info(f"🔁 Semantic cache match: {self._urns[best]} (sim={sims[best]:.3f})")
+            return self._urns[best]
+        return None
+
+    def add(self, school: School) -> None:
+        import numpy as np
+        row = self._embed(school)[None, :]
+        self._matrix = row if self._matrix is None else np.vstack([self._matrix, row])
+        self._urns.append(school.urn)
+
+
 class SchoolIntelligenceService:
     """
     Main service that orchestrates everything.
@@ -148,21 +263,30 @@ class SchoolIntelligenceService:
         self.conversation_chain = None  # Lazy load to avoid API calls at startup
         self.ofsted_chain = None  # Lazy load Ofsted analyzer
         self.cache = SimpleCache()
-        
+        self.semantic_cache = SemanticCache() if FEATURES.get("semantic_cache") else None
+        self._priority_sorted: Optional[List[School]] = None  # Built on first use
+
+        # Concurrent sessions requesting the same school share one
+        # in-flight LLM call instead of firing duplicates (see
+        # get_school_intelligence)
+        self._inflight: Dict[tuple, "Future"] = {}
+        self._inflight_lock = threading.Lock()
+
         logger.info("✅ SchoolIntelligenceService initialized")
     
-    def _get_chain(self) -> ConversationChain:
+    def _get_chain(self) -> 'ConversationChain':
         """Lazy-load the conversation chain (avoids API calls at startup)"""
         if self.conversation_chain is None:
+            from chains.conversation_chain import ConversationChain
             self.conversation_chain = ConversationChain()
         return self.conversation_chain
     
     def _get_ofsted_chain(self) -> Optional['OfstedChain']:
         """Lazy-load the Ofsted chain"""
-        if not OFSTED_AVAILABLE:
+        if not _ofsted_available():
             return None
         if self.ofsted_chain is None:
-            self.ofsted_chain = get_ofsted_chain()
+            self.ofsted_chain = _OFSTED_FACTORY()
         return self.ofsted_chain
     
     
@@ -227,27 +351,66 @@ class SchoolIntelligenceService:
             cached_starters = self.cache.get(school.urn)
             if cached_starters:
                 school.conversation_starters = [
-                    ConversationStarter(**s) for s in cached_starters
+                    ConversationStarter.model_construct(**s) for s in cached_starters
                 ]
                 return school
-        
-        # Generate new starters using LLM
+
+            # Near-duplicate school already analyzed? Reuse its starters
+            if self.semantic_cache is not None:
+                donor_urn = self.semantic_cache.lookup(school)
+                if donor_urn:
+                    donor_starters = self.cache.get(donor_urn)
+                    if donor_starters:
+                        school.conversation_starters = [
+                            ConversationStarter.model_construct(**s) for s in donor_starters
+                        ]
+                        return school
+
+        # Generate new starters using LLM. Each Streamlit session runs in
+        # its own thread, so two users clicking the same school would fire
+        # duplicate LLM calls - coalesce them: the first thread generates,
+        # the rest block on its Future and share the result.
+        key = (school.urn, num_starters)
+        with self._inflight_lock:
+            fut = self._inflight.get(key)
+            if fut is None:
+                fut = Future()
+                self._inflight[key] = fut
+                is_owner = True
+            else:
+                is_owner = False
+
+        if not is_owner:
+            try:
+                logger.info(f"⏳ Joining in-flight generation for {school_name}")
+                school.conversation_starters = fut.result(timeout=120)
+            except Exception as e:
+                logger.error(f"❌ Error generating intelligence: {e}")
+            return school
+
         try:
             chain = self._get_chain()
             response = chain.generate(school, num_starters)
-            
+
             # Add starters to school
             school.conversation_starters = response.conversation_starters
-            
+
             # Cache the results
             self.cache.set(school.urn, response.conversation_starters)
-            
+            if self.semantic_cache is not None:
+                self.semantic_cache.add(school)
+
+            fut.set_result(response.conversation_starters)
             return school
-            
+
         except Exception as e:
+            fut.set_exception(e)
             logger.error(f"❌ Error generating intelligence: {e}")
             # Return school without starters on error
             return school
+        finally:
+            with self._inflight_lock:
+                self._inflight.pop(key, None)
     
     async def get_school_intelligence_async(
         self, 
@@ -271,7 +434,7 @@ class SchoolIntelligenceService:
             cached_starters = self.cache.get(school.urn)
             if cached_starters:
                 school.conversation_starters = [
-                    ConversationStarter(**s) for s in cached_starters
+                    ConversationStarter.model_construct(**s) for s in cached_starters
                 ]
                 return school
         
@@ -287,7 +450,59 @@ class SchoolIntelligenceService:
         except Exception as e:
             logger.error(f"❌ Async error: {e}")
             return school
-    
+
+    async def astream_school_intelligence(
+        self,
+        school_name: str,
+        num_starters: int = 5
+    ):
+        """
+        Streaming version of get_school_intelligence.
+
+        Yields ConversationStarter objects one by one as the LLM completes
+        them, so the UI can show the first starter in well under a second
+        instead of spinning for the whole call. Always regenerates (the UI
+        only streams from the explicit Generate button) and caches the
+        full set once the stream finishes.
+        """
+        school = self.data_loader.get_school_by_name(school_name)
+        if not school:
+            logger.warning(f"⚠️ School not found: {school_name}")
+            return
+
+        if not FEATURES.get("conversation_starters", True):
+            return
+
+        chain = self._get_chain()
+        collected: List[ConversationStarter] = []
+        try:
+            async for starter in chain.astream_starters(school, num_starters):
+                collected.append(starter)
+                yield starter
+        except Exception as e:
+            logger.error(f"❌ Streaming error: {e}")
+            return
+
+        if collected:
+            self.cache.set(school.urn, collected)
+            if self.semantic_cache is not None:
+                self.semantic_cache.add(school)
+
+    @staticmethod
+    def _apply_ofsted_report(school: School, report: Dict[str, Any]) -> None:
+        """Attach the fetched report fields to the school model."""
+        from models_v2 import OfstedData
+        school.ofsted = OfstedData(
+            rating=report.get("rating"),
+            inspection_date=report.get("inspection_date"),
+            report_url=report.get("report_url"),
+            areas_for_improvement=[
+                imp.get("description", "")
+                for imp in report.get("improvements", [])[:5]
+            ]
+        )
+
+
     def get_school_intelligence_with_ofsted(
         self,
         school_name: str,
@@ -300,8 +515,8 @@ class SchoolIntelligenceService:
         
         This method:
         1. Gets school data from CSV
-        2. Analyzes Ofsted report (downloads PDF, extracts improvements)
-        3. Generates conversation starters using BOTH financial + Ofsted data
+        2. Fetches the Ofsted report (PDF download + regex extraction, no LLM)
+        3. One fused LLM call generates starters from BOTH financial + Ofsted data
         
         Args:
             school_name: Name of the school
@@ -323,78 +538,111 @@ class SchoolIntelligenceService:
             cached_starters = self.cache.get(school.urn)
             if cached_starters:
                 school.conversation_starters = [
-                    ConversationStarter(**s) for s in cached_starters
+                    ConversationStarter.model_construct(**s) for s in cached_starters
                 ]
                 logger.info(f"📦 Using cached starters for {school_name}")
                 return school
         
-        all_starters = []
-        ofsted_data = None
-        
-        # Step 1: Ofsted analysis (if enabled and available)
-        if include_ofsted and OFSTED_AVAILABLE and FEATURES.get("ofsted_analysis", True):
+        # Step 1: Fetch the Ofsted report - PDF download + regex only, the
+        # LLM analysis is folded into the fused call below
+        report = None
+        if include_ofsted and _ofsted_available() and FEATURES.get("ofsted_analysis", True):
             try:
-                logger.info(f"🔍 Fetching Ofsted data for {school_name}...")
+                logger.info(f"🔍 Fetching Ofsted report for {school_name}...")
                 ofsted_chain = self._get_ofsted_chain()
-                
+
                 if ofsted_chain:
-                    ofsted_result = ofsted_chain.analyze(school_name, school.urn)
-                    
-                    if ofsted_result and not ofsted_result.get("error"):
-                        # Update school with Ofsted data
-                        from models_v2 import OfstedData
-                        school.ofsted = OfstedData(
-                            rating=ofsted_result.get("rating"),
-                            inspection_date=ofsted_result.get("inspection_date"),
-                            report_url=ofsted_result.get("report_url"),
-                            areas_for_improvement=[
-                                imp.get("description", "") 
-                                for imp in ofsted_result.get("improvements", [])[:5]
-                            ]
-                        )
-                        
-                        # Add Ofsted conversation starters (WITH SOURCE URLs!)
-                        ofsted_starters = ofsted_result.get("conversation_starters", [])
-                        all_starters.extend(ofsted_starters)
-                        
-                        logger.info(f"✅ Got {len(ofsted_starters)} Ofsted-based starters")
+                    report = ofsted_chain.fetch_report(school_name, school.urn)
+                    if report.get("error"):
+                        logger.warning(f"⚠️ Ofsted fetch failed: {report.get('error')}")
+                        report = None
                     else:
-                        logger.warning(f"⚠️ Ofsted analysis returned error: {ofsted_result.get('error')}")
-                        
+                        self._apply_ofsted_report(school, report)
+
             except Exception as e:
-                logger.error(f"❌ Ofsted analysis failed: {e}")
+                logger.error(f"❌ Ofsted fetch failed: {e}")
+                report = None
                 # Continue without Ofsted data
-        
-        # Step 2: Generate financial-based conversation starters
+
+        # Step 2: ONE LLM call - fused Ofsted + financial starters when we
+        # have a report, plain financial starters otherwise
         if FEATURES.get("conversation_starters", True):
             try:
                 chain = self._get_chain()
-                
-                # Reduce number if we already have Ofsted starters
-                remaining = max(1, num_starters - len(all_starters))
-                
-                response = chain.generate(school, remaining)
-                all_starters.extend(response.conversation_starters)
-                
+                if report is not None:
+                    response = chain.generate_combined(school, report, num_starters)
+                else:
+                    response = chain.generate(school, num_starters)
+                school.conversation_starters = response.conversation_starters
+
             except Exception as e:
                 logger.error(f"❌ Error generating starters: {e}")
-        
-        # Combine and deduplicate starters
-        # Prioritize Ofsted starters (they have source URLs!)
-        seen_topics = set()
-        unique_starters = []
-        
-        for starter in all_starters:
-            if starter.topic not in seen_topics:
-                seen_topics.add(starter.topic)
-                unique_starters.append(starter)
-        
-        # Limit to requested number
-        school.conversation_starters = unique_starters[:num_starters]
-        
+
         # Cache the results
         self.cache.set(school.urn, school.conversation_starters)
-        
+
+        logger.info(f"✅ Generated {len(school.conversation_starters)} total starters for {school_name}")
+        return school
+
+    async def get_school_intelligence_with_ofsted_async(
+        self,
+        school_name: str,
+        force_refresh: bool = False,
+        num_starters: int = 5,
+        include_ofsted: bool = True
+    ) -> Optional[School]:
+        """
+        Async version of get_school_intelligence_with_ofsted.
+
+        The report fetch (search + PDF, no LLM) runs on a worker thread,
+        then one fused LLM call covers both Ofsted and financial starters.
+        """
+        school = self.data_loader.get_school_by_name(school_name)
+        if not school:
+            logger.warning(f"⚠️ School not found: {school_name}")
+            return None
+
+        # Check cache first
+        if not force_refresh:
+            cached_starters = self.cache.get(school.urn)
+            if cached_starters:
+                school.conversation_starters = [
+                    ConversationStarter.model_construct(**s) for s in cached_starters
+                ]
+                logger.info(f"📦 Using cached starters for {school_name}")
+                return school
+
+        report = None
+        if include_ofsted and _ofsted_available() and FEATURES.get("ofsted_analysis", True):
+            ofsted_chain = self._get_ofsted_chain()
+            if ofsted_chain:
+                try:
+                    # Blocking requests/PyPDF2 pipeline - worker thread
+                    report = await asyncio.to_thread(
+                        ofsted_chain.fetch_report, school_name, school.urn
+                    )
+                    if report.get("error"):
+                        logger.warning(f"⚠️ Ofsted fetch failed: {report.get('error')}")
+                        report = None
+                    else:
+                        self._apply_ofsted_report(school, report)
+                except Exception as e:
+                    logger.error(f"❌ Ofsted fetch failed: {e}")
+                    report = None
+
+        if FEATURES.get("conversation_starters", True):
+            try:
+                chain = self._get_chain()
+                if report is not None:
+                    response = await chain.agenerate_combined(school, report, num_starters)
+                else:
+                    response = await chain.agenerate(school, num_starters)
+                school.conversation_starters = response.conversation_starters
+            except Exception as e:
+                logger.error(f"❌ Error generating starters: {e}")
+
+        self.cache.set(school.urn, school.conversation_starters)
+
         logger.info(f"✅ Generated {len(school.conversation_starters)} total starters for {school_name}")
         return school
 
@@ -404,17 +652,37 @@ class SchoolIntelligenceService:
         
         Returns schools sorted by sales priority.
         """
-        schools = self.data_loader.get_all_schools()
-        
-        # Sort by priority (HIGH first)
-        priority_order = {"HIGH": 0, "MEDIUM": 1, "LOW": 2, "UNKNOWN": 3}
-        sorted_schools = sorted(
-            schools, 
-            key=lambda s: priority_order.get(s.get_sales_priority(), 3)
-        )
-        
-        return sorted_schools[:limit]
+        if self._priority_sorted is None:
+            # The loader already bucketed schools by priority at load time;
+            # concatenating the buckets IS the sort, done once
+            ordered: List[School] = []
+            for tier in ("HIGH", "MEDIUM", "LOW", "UNKNOWN"):
+                ordered.extend(self.data_loader.get_schools_by_priority(tier))
+            self._priority_sorted = ordered
+
+        return self._priority_sorted[:limit]
     
+    async def prewarm_top_k(self, k: int = 10) -> int:
+        """
+        Pre-generate starters for the top-k staffing spenders that aren't
+        cached yet, concurrently - the same list the Top Staffing
+        Spenders panel renders - so clicks on it hit cache instead of
+        waiting on a live LLM call.
+
+        Returns the number of schools warmed.
+        """
+        schools = self.data_loader.get_top_spenders(limit=k, spend_type="total")
+        uncached = [s for s in schools if not self.cache.get(s.urn)]
+        if not uncached:
+            return 0
+
+        logger.info(f"🔥 Prewarming starters for {len(uncached)} schools")
+        await asyncio.gather(
+            *[self.get_school_intelligence_async(s.school_name) for s in uncached],
+            return_exceptions=True,
+        )
+        return len(uncached)
+
     def get_schools_with_agency_spend(self) -> List[School]:
         """Get schools that spend on agency staff"""
         return self.data_loader.get_schools_with_agency_spend()
@@ -434,6 +702,7 @@ class SchoolIntelligenceService:
     
     def refresh_data(self) -> List[School]:
         """Force reload data from source"""
+        self._priority_sorted = None
         return self.data_loader.refresh()
 
 
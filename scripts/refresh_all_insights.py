@@ -0,0 +1,247 @@
+"""
+School Research Assistant - Bulk Insight Refresh
+=================================================
+Regenerates conversation starters for EVERY school through the provider's
+Batch API instead of one real-time call per school.
+
+WHY BATCH:
+- Batched requests are billed at ~50% of real-time pricing
+- Results land within hours - fine for a nightly/weekly refresh
+- The app then serves everything from cache instantly
+
+Usage:
+    python scripts/refresh_all_insights.py
+"""
+
+import json
+import logging
+import sys
+import time
+from pathlib import Path
+
+# Add the project root to Python path
+PROJECT_ROOT = Path(__file__).parent.parent
+if str(PROJECT_ROOT) not in sys.path:
+    sys.path.insert(0, str(PROJECT_ROOT))
+
+from config_v2 import (
+    LLM_PROVIDER,
+    get_model,
+    get_api_keys,
+    LLM_TEMPERATURE,
+    LLM_MAX_TOKENS,
+    CACHE_DIR,
+)
+from data_loader import get_data_loader
+from models_v2 import ConversationStarter
+from prompts.templates import (
+    CONVERSATION_STARTERS_SYSTEM,
+    CONVERSATION_STARTERS_HUMAN,
+)
+from school_intelligence_service import SimpleCache
+
+logging.basicConfig(level=logging.INFO)
+logger = logging.getLogger(__name__)
+
+NUM_STARTERS = 5
+POLL_SECONDS = 30
+
+# Append-only checkpoint: one line per completed (urn, prompt) pair, so a
+# crash at school 20/28 resumes with the 8 remaining instead of redoing 28
+CHECKPOINT_PATH = Path(CACHE_DIR) / "refresh_checkpoint.jsonl"
+
+
+def load_checkpoint() -> set:
+    """Keys already completed by a previous (possibly crashed) run."""
+    if not CHECKPOINT_PATH.exists():
+        return set()
+    seen = set()
+    with open(CHECKPOINT_PATH) as f:
+        for line in f:
+            try:
+                seen.add(json.loads(line)["key"])
+            except (json.JSONDecodeError, KeyError):
+                continue  # torn write from a crash - redo that school
+    return seen
+
+
+def append_checkpoint(key: str, text: str) -> None:
+    """Record one completed result (append is atomic enough per line)."""
+    CHECKPOINT_PATH.parent.mkdir(exist_ok=True)
+    with open(CHECKPOINT_PATH, "a") as f:
+        f.write(json.dumps({"key": key, "result": text}) + "\n")
+
+
+def render_prompts(schools) -> list:
+    """Render the starters prompt for each school -> [(custom_id, human_text)]"""
+    rendered = []
+    for school in schools:
+        human = CONVERSATION_STARTERS_HUMAN.format(
+            num_starters=NUM_STARTERS,
+            school_context=school.to_llm_context(),
+        )
+        rendered.append((f"{school.urn}:starters", human))
+    return rendered
+
+
+def run_anthropic_batch(rendered: list) -> dict:
+    """Submit one Message Batch and poll until it completes."""
+    import anthropic
+
+    client = anthropic.Anthropic(api_key=get_api_keys()["anthropic"])
+
+    batch = client.messages.batches.create(
+        requests=[
+            {
+                "custom_id": custom_id.replace(":", "_"),
+                "params": {
+                    "model": get_model("primary"),
+                    "max_tokens": LLM_MAX_TOKENS,
+                    "temperature": LLM_TEMPERATURE,
+                    "system": CONVERSATION_STARTERS_SYSTEM,
+                    "messages": [{"role": "user", "content": human}],
+                },
+            }
+            for custom_id, human in rendered
+        ]
+    )
+    logger.info(f"📤 Submitted batch {batch.id} with {len(rendered)} requests")
+
+    while True:
+        batch = client.messages.batches.retrieve(batch.id)
+        if batch.processing_status == "ended":
+            break
+        logger.info(f"⏳ Batch {batch.id}: {batch.processing_status}")
+        time.sleep(POLL_SECONDS)
+
+    results = {}
+    for entry in client.messages.batches.results(batch.id):
+        if entry.result.type == "succeeded":
+            custom_id = entry.custom_id.replace("_", ":", 1)
+            results[custom_id] = entry.result.message.content[0].text
+        else:
+            logger.warning(f"⚠️ {entry.custom_id} failed: {entry.result.type}")
+    return results
+
+
+def run_openai_batch(rendered: list) -> dict:
+    """Submit an OpenAI batch file and poll until it completes."""
+    from openai import OpenAI
+
+    client = OpenAI(api_key=get_api_keys()["openai"])
+
+    lines = [
+        json.dumps({
+            "custom_id": custom_id,
+            "method": "POST",
+            "url": "/v1/chat/completions",
+            "body": {
+                "model": get_model("primary"),
+                "temperature": LLM_TEMPERATURE,
+                "max_tokens": LLM_MAX_TOKENS,
+                "messages": [
+                    {"role": "system", "content": CONVERSATION_STARTERS_SYSTEM},
+                    {"role": "user", "content": human},
+                ],
+            },
+        })
+        for custom_id, human in rendered
+    ]
+
+    # The Batch API requires a named .jsonl upload, not raw bytes
+    batch_file = client.files.create(
+        file=("refresh.jsonl", "\n".join(lines).encode("utf-8")),
+        purpose="batch",
+    )
+    batch = client.batches.create(
+        input_file_id=batch_file.id,
+        endpoint="/v1/chat/completions",
+        completion_window="24h",
+    )
+    logger.info(f"📤 Submitted batch {batch.id} with {len(rendered)} requests")
+
+    while True:
+        batch = client.batches.retrieve(batch.id)
+        if batch.status in ("completed", "failed", "expired", "cancelled"):
+            break
+        logger.info(f"⏳ Batch {batch.id}: {batch.status}")
+        time.sleep(POLL_SECONDS)
+
+    if batch.status != "completed" or not batch.output_file_id:
+        logger.error(f"❌ Batch ended with status: {batch.status}")
+        return {}
+
+    results = {}
+    output = client.files.content(batch.output_file_id).text
+    for line in output.splitlines():
+        entry = json.loads(line)
+        response = entry.get("response") or {}
+        if response.get("status_code") == 200:
+            body = response["body"]
+            results[entry["custom_id"]] = body["choices"][0]["message"]["content"]
+        else:
+            logger.warning(f"⚠️ {entry.get('custom_id')} failed: {response.get('status_code')}")
+    return results
+
+
+def parse_starters(text: str) -> list:
+    """Parse the model's JSON response into ConversationStarter objects."""
+    cleaned = text.strip()
+    if cleaned.startswith("```"):
+        cleaned = cleaned.strip("`")
+        if cleaned.startswith("json"):
+            cleaned = cleaned[4:]
+    data = json.loads(cleaned)
+    return [ConversationStarter(**s) for s in data.get("conversation_starters", [])]
+
+
+def main() -> None:
+    loader = get_data_loader()
+    schools = loader.get_all_schools()
+    logger.info(f"🔄 Refreshing insights for {len(schools)} schools via {LLM_PROVIDER} batch")
+
+    seen = load_checkpoint()
+    rendered = [
+        (custom_id, human)
+        for custom_id, human in render_prompts(schools)
+        if custom_id not in seen
+    ]
+    if seen:
+        logger.info(f"⏭️ Skipping {len(seen)} schools already completed (checkpoint)")
+    if not rendered:
+        logger.info("✅ Nothing to refresh - delete the checkpoint to force a full run")
+        logger.info(f"   ({CHECKPOINT_PATH})")
+        return
+
+    if LLM_PROVIDER == "anthropic":
+        results = run_anthropic_batch(rendered)
+    else:
+        results = run_openai_batch(rendered)
+
+    cache = SimpleCache()
+    materialized = 0
+    for custom_id, text in results.items():
+        urn = custom_id.split(":", 1)[0]
+        try:
+            starters = parse_starters(text)
+        except (json.JSONDecodeError, TypeError, ValueError) as e:
+            logger.warning(f"⚠️ Could not parse response for {urn}: {e}")
+            continue
+        if starters:
+            cache.set(urn, starters)
+            append_checkpoint(custom_id, text)
+            materialized += 1
+
+    if materialized == len(rendered):
+        # Every outstanding school is now cached - clear the checkpoint
+        # so the next scheduled run does a full refresh instead of
+        # resuming into "Nothing to refresh". Crash-resume only applies
+        # within an incomplete run.
+        CHECKPOINT_PATH.unlink(missing_ok=True)
+        logger.info("🧹 Batch complete - checkpoint cleared for the next full run")
+
+    logger.info(f"✅ Cached fresh starters for {materialized}/{len(schools)} schools")
+
+
+if __name__ == "__main__":
+    main()
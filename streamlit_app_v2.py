@@ -8,12 +8,11 @@ UPDATED:
 - Displays headteacher contact details
 """
 
+from __future__ import annotations
+
 import streamlit as st
-import pandas as pd
-from datetime import datetime
 import logging
 import sys
-import os
 from pathlib import Path
 
 # Add the project root to Python path
@@ -21,14 +20,20 @@ PROJECT_ROOT = Path(__file__).parent
 if str(PROJECT_ROOT) not in sys.path:
     sys.path.insert(0, str(PROJECT_ROOT))
 
-# Import our modules
-from school_intelligence_service import get_intelligence_service
-from data_loader import get_data_loader
-from models_v2 import School, ConversationStarter
+# Only the cheap config import happens up front: pandas, the data loader
+# and the LangChain-backed service are deferred until after the password
+# gate so the login page renders without paying their import cost.
 from config_v2 import get_app_password, LLM_PROVIDER, FEATURES, get_display_label
 
-# Set up logging
-logging.basicConfig(level=logging.INFO)
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from models_v2 import School
+
+# Set up logging (guarded - Streamlit re-executes this module on every
+# rerun, and basicConfig should only configure the root logger once)
+if not logging.getLogger().handlers:
+    logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
 
@@ -75,182 +80,232 @@ def check_password() -> bool:
 # STYLING
 # =============================================================================
 
-st.markdown("""
-<style>
-    .stApp h1, .stApp h2, .stApp h3, .stApp h4, .stApp h5, .stApp h6 {
-        color: #E8E8E8 !important;
-    }
-    
-    .stApp p, .stApp span, .stApp label, .stApp div {
-        color: #D0D0D0 !important;
-    }
-    
-    .stMarkdown, .stMarkdown p, .stMarkdown span {
-        color: #D0D0D0 !important;
-    }
-    
-    [data-testid="stMetricLabel"], [data-testid="stMetricValue"] {
-        color: #E8E8E8 !important;
-    }
-    
-    .stTabs [data-baseweb="tab"] {
-        color: #D0D0D0 !important;
-    }
-    
-    .starter-card {
-        background-color: #2D2D3A;
-        border-left: 4px solid #0066ff;
-        padding: 1rem;
-        margin: 0.5rem 0;
-        border-radius: 0 8px 8px 0;
-    }
-    
-    .starter-topic {
-        font-weight: 600;
-        color: #5CA8FF !important;
-        margin-bottom: 0.5rem;
-    }
-    
-    .starter-detail {
-        color: #E0E0E0 !important;
-        line-height: 1.6;
-    }
-    
-    .priority-high {
-        background-color: #dc3545;
-        color: white !important;
-        padding: 0.25rem 0.75rem;
-        border-radius: 20px;
-        font-weight: 600;
-        font-size: 0.85rem;
-    }
-    
-    .priority-medium {
-        background-color: #ffc107;
-        color: black !important;
-        padding: 0.25rem 0.75rem;
-        border-radius: 20px;
-        font-weight: 600;
-        font-size: 0.85rem;
-    }
-    
-    .priority-low {
-        background-color: #28a745;
-        color: white !important;
-        padding: 0.25rem 0.75rem;
-        border-radius: 20px;
-        font-weight: 600;
-        font-size: 0.85rem;
-    }
-    
-    .financial-highlight {
-        background-color: #3D3D2A;
-        padding: 1rem;
-        border-radius: 8px;
-        margin: 0.5rem 0;
-    }
-    
-    .staffing-spend-high {
-        background-color: #2A4D3D;
-        padding: 1rem;
-        border-radius: 8px;
-        margin: 0.5rem 0;
-        border-left: 4px solid #28a745;
-    }
-    
-    .contact-card {
-        background-color: #2A3D4D;
-        padding: 1rem;
-        border-radius: 8px;
-        margin: 0.5rem 0;
-    }
-</style>
-""", unsafe_allow_html=True)
+_CSS_PATH = Path(__file__).parent / "static" / "app.css"
+
+# HTML templates as module constants: st.html skips the Markdown parser
+# st.markdown runs even on pure HTML, and the f-string work happens once
+# at import instead of per render
+_STAFFING_HTML = (
+    '<div class="staffing-spend-high">'
+    '<h3>💰 Total Staffing Budget: £{spend:,.0f}</h3>'
+    '<p>This school invests significantly in staffing - opportunity for '
+    'permanent, temporary & agency placements.</p></div>'
+)
+
+_CONTACT_HTML = (
+    '<div class="contact-card">'
+    '<h4>🎓 {name}</h4>'
+    '<p><strong>Role:</strong> Headteacher</p></div>'
+)
+
+_STARTER_CARD_HTML = (
+    '<div class="starter-card">'
+    '<div class="starter-topic">{i}. {topic}</div>'
+    '<div class="starter-detail">{detail}</div>'
+    '{source_html}</div>'
+)
+
+
+@st.cache_resource
+def _inject_css() -> None:
+    """Inject the app stylesheet once per session (elements in cached
+    functions are replayed on reruns without re-running the function).
+    The rules live in static/app.css so the Python module stays small
+    and the file is read from disk once per process."""
+    st.html(f"<style>{_CSS_PATH.read_text()}</style>")
+
+
+_inject_css()
 
 
 # =============================================================================
 # MAIN APP
 # =============================================================================
 
-def main():
-    """Main application logic"""
-    
-    if not check_password():
-        return
-    
-    service = get_intelligence_service()
-    data_loader = get_data_loader()
-    
-    st.title("🎓 School Research Assistant")
-    st.caption("Powered by AI • London Schools • Financial & Contact Intelligence")
-    
-    # Load schools
-    with st.spinner("Loading schools..."):
-        school_names = service.get_school_names()
-        stats = service.get_statistics()
-    
-    # Sidebar
+@st.cache_resource
+def _get_service():
+    """Process-wide intelligence service, memoized by Streamlit.
+
+    cache_resource survives session teardown and is thread-safe, so every
+    session shares the one fully-initialized service (loaded schools,
+    warm caches) and reruns pay a dict lookup, not module resolution.
+    """
+    from school_intelligence_service import get_intelligence_service
+    return get_intelligence_service()
+
+
+@st.cache_resource
+def _get_loader():
+    """Process-wide data loader, memoized by Streamlit."""
+    from data_loader import get_data_loader
+    return get_data_loader()
+
+
+@st.cache_data(ttl=3600, persist="disk")
+def _cached_school_names() -> tuple:
+    """School names for the dropdown - cached across reruns and sessions.
+
+    persist="disk" lets a recycled worker serve the first paint from the
+    pickled cache instead of re-walking the loader."""
+    return tuple(_get_service().get_school_names())
+
+
+@st.cache_data(ttl=3600, persist="disk")
+def _cached_stats() -> dict:
+    """Dashboard statistics - cached across reruns and sessions."""
+    return _get_service().get_statistics()
+
+
+@st.cache_data(ttl=3600, persist="disk")
+def _cached_top_spender_rows(limit: int = 10) -> list:
+    """Display rows for the top-spenders table.
+
+    Cached as plain dicts so reruns skip both the top-k selection and
+    the per-school formatting.
+    """
+    return [{
+        "School": s.school_name,
+        "Total Staffing Spend": f"£{(s.financial.total_teaching_support_costs or 0):,.0f}",
+        "Local Authority": s.la_name or "",
+        "Priority": s.get_sales_priority(),
+    } for s in _get_loader().get_top_spenders(limit=limit, spend_type="total")]
+
+
+@st.fragment
+def _sidebar(stats: dict) -> None:
+    """Sidebar dashboard and filters.
+
+    Fragment-scoped: quick-filter clicks redraw only the sidebar instead
+    of the whole app. The LA selection is shared through session state
+    and a change triggers one app-wide rerun so the main panel picks it
+    up; everything else stays isolated.
+    """
     with st.sidebar:
         st.header("📊 Dashboard")
-        
+
         col1, col2 = st.columns(2)
         with col1:
             st.metric("Total Schools", f"{stats['total_schools']:,}")
         with col2:
             st.metric("High Priority", stats["high_priority"])
-        
+
         col3, col4 = st.columns(2)
         with col3:
             st.metric("With Contacts", stats.get("with_contacts", 0))
         with col4:
             st.metric("Local Authorities", stats.get("boroughs", 33))
-        
-        # Total staffing spend
-        st.metric("Total Staffing Spend", stats.get("total_staffing_spend", "N/A"))
-        
+
+        # Total staffing spend (raw float from the loader)
+        st.metric("Total Staffing Spend", f"£{stats.get('total_staffing_spend', 0):,.0f}")
+
         st.divider()
-        
+
         # Local Authority filter (not "Borough")
         st.subheader("🏛️ Filter by Local Authority")
-        local_authorities = data_loader.get_boroughs()
+        local_authorities = _get_loader().get_boroughs()
         selected_la = st.selectbox(
             "Select Local Authority",
-            options=["All Local Authorities"] + local_authorities,
-            index=0
+            options=["All Local Authorities", *local_authorities],
+            index=0,
+            key="selected_la"
         )
-        
+        if selected_la != st.session_state.get("_la_applied"):
+            st.session_state._la_applied = selected_la
+            st.rerun(scope="app")
+
         st.divider()
-        
+
         st.subheader("🎯 Quick Filters")
-        
-        if st.button("💰 Top Staffing Spenders"):
-            st.session_state.filter = "top_spenders"
-        if st.button("⚡ High Priority"):
-            st.session_state.filter = "high"
-        if st.button("📊 All Schools"):
-            st.session_state.filter = "all"
+
+        # One segmented control instead of three buttons - a single
+        # widget to diff, and the fragment keeps clicks sidebar-local
+        filters = {
+            "💰 Top Spenders": "top_spenders",
+            "⚡ High Priority": "high",
+            "📊 All Schools": "all",
+        }
+        choice = st.segmented_control(
+            "Quick Filters",
+            options=list(filters),
+            label_visibility="collapsed",
+        )
+        if choice:
+            st.session_state.filter = filters[choice]
+
+
+def main():
+    """Main application logic"""
+
+    if not check_password():
+        return
+
+    # Heavy imports happen inside the cached getters, past the password gate
+    service = _get_service()
+    data_loader = _get_loader()
     
+    st.title("🎓 School Research Assistant")
+    st.caption("Powered by AI • London Schools • Financial & Contact Intelligence")
+    
+    # Load schools (cached - reruns skip the loader entirely)
+    with st.spinner("Loading schools..."):
+        school_names = _cached_school_names()
+        stats = _cached_stats()
+
+    # Prewarm starters for the suggested schools once per session so
+    # clicking them serves from cache instead of a live LLM call
+    if FEATURES.get("conversation_starters", True) and not st.session_state.get("warmed"):
+        st.session_state.warmed = True
+        import asyncio
+        import threading
+        threading.Thread(
+            target=lambda: asyncio.run(service.prewarm_top_k()),
+            daemon=True,
+        ).start()
+    
+    # Sidebar (fragment-scoped - see _sidebar)
+    st.session_state.setdefault("_la_applied", "All Local Authorities")
+    _sidebar(stats)
+    selected_la = st.session_state.get("selected_la", "All Local Authorities")
+
     # Main content
     st.header("🔍 Search Schools")
     
     # Filter by Local Authority if selected
     if selected_la and selected_la != "All Local Authorities":
-        filtered_names = [
-            s.school_name for s in data_loader.get_schools_by_borough(selected_la)
-        ]
-        display_names = sorted(filtered_names)
+        # Pre-sorted per LA at load time - no filter + sort per rerun
+        display_names = data_loader.get_school_names_by_la(selected_la)
         st.info(f"Showing {len(display_names)} schools in {selected_la}")
     else:
         display_names = school_names
     
-    # School selector
-    selected_school_name = st.selectbox(
-        "Select a school",
-        options=[""] + display_names,
-        index=0,
-        placeholder="Choose a school...",
-        help="Select a school to view details and generate conversation starters"
+    # School selector: a search box + top-20 matches instead of a
+    # selectbox over every school - the browser only ever receives a
+    # handful of names per keystroke, not the full list
+    query = st.text_input(
+        "Search for a school",
+        placeholder="Start typing a school name...",
+        help="Type at least 2 characters to search"
     )
+
+    selected_school_name = ""
+    if len(query) >= 2:
+        if selected_la and selected_la != "All Local Authorities":
+            # LA-filtered lists are small; scan them directly
+            q = query.casefold()
+            matches = [n for n in display_names if q in n.casefold()][:20]
+        else:
+            # Full corpus: one C-level scan over the loader's
+            # pre-lowercased name array
+            matches = data_loader.search_school_names(query, limit=20)
+        if matches:
+            selected_school_name = st.selectbox(
+                "Select a school",
+                options=matches,
+                index=0,
+                help="Select a school to view details and generate conversation starters"
+            )
+        else:
+            st.warning(f"No schools matching '{query}'")
     
     if selected_school_name:
         school = service.get_school_by_name(selected_school_name)
@@ -263,34 +318,31 @@ def main():
         st.subheader("💰 Top Staffing Spenders (Best Opportunities)")
         st.caption("Schools with largest staffing budgets - opportunities for permanent, temporary & agency placements")
         
-        top_spenders = data_loader.get_top_spenders(limit=10, spend_type="total")
-        
-        if top_spenders:
-            for school in top_spenders:
-                col1, col2, col3, col4 = st.columns([4, 2, 1, 1])
-                
-                with col1:
-                    if st.button(f"📍 {school.school_name}", key=f"select_{school.urn}"):
-                        st.session_state.selected_school = school.school_name
-                        st.rerun()
-                
-                with col2:
-                    spend = school.financial.total_teaching_support_costs or 0
-                    st.markdown(f"**£{spend:,.0f}**")
-                
-                with col3:
-                    st.caption(school.la_name or "")
-                
-                with col4:
-                    priority = school.get_sales_priority()
-                    if priority == "HIGH":
-                        st.markdown('<span class="priority-high">HIGH</span>', unsafe_allow_html=True)
-                    elif priority == "MEDIUM":
-                        st.markdown('<span class="priority-medium">MED</span>', unsafe_allow_html=True)
+        rows = _cached_top_spender_rows(limit=10)
+
+        if rows:
+            # One dataframe widget instead of a button + markdown per row -
+            # a single frontend element to diff on every rerun. Row
+            # selection replaces the per-school buttons.
+            event = st.dataframe(
+                rows,
+                hide_index=True,
+                use_container_width=True,
+                on_select="rerun",
+                selection_mode="single-row",
+            )
+            if event.selection.rows:
+                st.session_state.selected_school = rows[event.selection.rows[0]]["School"]
+                st.rerun()
 
 
+@st.fragment
 def display_school(school: School, service):
-    """Display school details and conversation starters"""
+    """Display school details and conversation starters.
+
+    Fragment-scoped: switching tabs or touching widgets in the detail
+    view reruns this function only, not the sidebar and school list.
+    """
     
     st.subheader(f"🏫 {school.school_name}")
     
@@ -312,12 +364,7 @@ def display_school(school: School, service):
     # Total staffing spend highlight (not just agency)
     if school.financial and school.financial.total_teaching_support_costs:
         spend = school.financial.total_teaching_support_costs
-        st.markdown(f"""
-        <div class="staffing-spend-high">
-            <h3>💰 Total Staffing Budget: £{spend:,.0f}</h3>
-            <p>This school invests significantly in staffing - opportunity for permanent, temporary & agency placements.</p>
-        </div>
-        """, unsafe_allow_html=True)
+        st.html(_STAFFING_HTML.format(spend=spend))
     
     st.divider()
     
@@ -342,29 +389,40 @@ def display_school(school: School, service):
         display_full_details(school)
 
 
+@st.fragment
 def display_conversation_starters(school: School, service):
-    """Display or generate conversation starters"""
+    """Display or generate conversation starters.
+
+    Runs as a fragment: clicking Generate reruns only this function, not
+    the whole app (sidebar, school list and dropdown stay untouched).
+    """
     
     st.subheader("💬 Conversation Starters")
     
     if school.conversation_starters:
         st.success(f"✅ {len(school.conversation_starters)} conversation starters ready")
-        
+
+        # Each widget call is a separate frontend message, so build all
+        # the cards as one HTML string and render with a single st.html
+        html_parts = []
         for i, starter in enumerate(school.conversation_starters, 1):
-            with st.expander(f"**{i}. {starter.topic}**", expanded=(i == 1)):
-                st.markdown(f"""
-                <div class="starter-card">
-                    <div class="starter-detail">{starter.detail}</div>
-                </div>
-                """, unsafe_allow_html=True)
-                
-                if starter.source:
-                    if starter.source.startswith("http"):
-                        st.markdown(f"📎 **Source:** [View Ofsted Report]({starter.source})")
-                    else:
-                        st.caption(f"📊 Source: {starter.source}")
-                
-                st.code(starter.detail, language=None)
+            if starter.source and starter.source.startswith("http"):
+                source_html = f'<div class="starter-source">📎 <a href="{starter.source}">View Ofsted Report</a></div>'
+            elif starter.source:
+                source_html = f'<div class="starter-source">📊 Source: {starter.source}</div>'
+            else:
+                source_html = ""
+            html_parts.append(_STARTER_CARD_HTML.format(
+                i=i, topic=starter.topic, detail=starter.detail,
+                source_html=source_html,
+            ))
+        st.html("\n".join(html_parts))
+
+        with st.expander("📋 Copy starters"):
+            st.code(
+                "\n---\n".join(s.detail for s in school.conversation_starters),
+                language=None
+            )
     
     # Ofsted info
     if school.ofsted and school.ofsted.rating:
@@ -387,23 +445,53 @@ def display_conversation_starters(school: School, service):
         if st.button("🚀 Generate Conversation Starters", type="primary"):
             if include_ofsted:
                 with st.spinner("🔍 Analyzing Ofsted + generating insights..."):
-                    school_with_starters = service.get_school_intelligence_with_ofsted(
-                        school.school_name,
-                        force_refresh=True,
-                        num_starters=num_starters,
-                        include_ofsted=True
+                    # Async path: the report fetch runs off the event
+                    # loop thread, then one fused LLM call produces the
+                    # Ofsted analysis and starters together
+                    import asyncio
+                    school_with_starters = asyncio.run(
+                        service.get_school_intelligence_with_ofsted_async(
+                            school.school_name,
+                            force_refresh=True,
+                            num_starters=num_starters,
+                            include_ofsted=True
+                        )
                     )
             else:
-                with st.spinner("Generating insights with AI..."):
-                    school_with_starters = service.get_school_intelligence(
+                # Stream starters as the LLM completes them: first one
+                # lands in well under a second instead of a 10s spinner.
+                # st.write_stream wants a sync generator, so bridge the
+                # async generator through a private event loop.
+                import asyncio
+
+                def _stream_starters():
+                    loop = asyncio.new_event_loop()
+                    agen = service.astream_school_intelligence(
                         school.school_name,
-                        force_refresh=True,
                         num_starters=num_starters
                     )
-                
+                    try:
+                        i = 0
+                        while True:
+                            try:
+                                starter = loop.run_until_complete(agen.__anext__())
+                            except StopAsyncIteration:
+                                break
+                            i += 1
+                            yield f"**{i}. {starter.topic}**\n\n{starter.detail}\n\n"
+                    finally:
+                        loop.close()
+
+                with st.status("Generating insights with AI...", expanded=True):
+                    st.write_stream(_stream_starters())
+                school_with_starters = service.get_school_intelligence(
+                    school.school_name,
+                    num_starters=num_starters
+                )
+
             if school_with_starters and school_with_starters.conversation_starters:
                 st.success(f"✅ Generated {len(school_with_starters.conversation_starters)} starters!")
-                st.rerun()
+                st.rerun(scope="fragment")
             else:
                 st.error("Failed to generate starters. Check your API key.")
 
@@ -417,12 +505,7 @@ def display_contact_info(school: School):
         # Parse headteacher name for title
         head = school.headteacher
         
-        st.markdown(f"""
-        <div class="contact-card">
-            <h4>🎓 {head.full_name}</h4>
-            <p><strong>Role:</strong> Headteacher</p>
-        </div>
-        """, unsafe_allow_html=True)
+        st.html(_CONTACT_HTML.format(name=head.full_name))
         
         # Contact details in columns
         col1, col2 = st.columns(2)
@@ -464,6 +547,42 @@ def display_contact_info(school: School):
         st.write(school.trust_name)
 
 
+@st.cache_data(ttl=3600)
+def _cost_breakdown_lines(urn: str) -> list:
+    """Pre-formatted cost-breakdown bullets, cached per URN.
+
+    Tab switches re-render the financial tab on every interaction; the
+    figures don't change, so format them once.
+    """
+    school = _get_loader().get_school_by_urn(urn)
+    fin = school.financial if school else None
+    if not fin:
+        return []
+
+    costs = [
+        ("Total Staffing Costs", fin.total_teaching_support_costs, True),
+        ("Teaching Staff (E01)", fin.teaching_staff_costs, False),
+        ("Supply Teaching (E02)", fin.supply_teaching_costs, False),
+        ("Educational Support (E03)", fin.educational_support_costs, False),
+        ("Agency Supply (E26)", fin.agency_supply_costs, False),
+        ("Consultancy (E27)", fin.educational_consultancy_costs, False),
+    ]
+
+    lines = []
+    for label, value, highlight in costs:
+        if value and value > 0:
+            # Calculate per pupil if we have pupil count
+            if fin.total_pupils and fin.total_pupils > 0:
+                per_pupil = value / fin.total_pupils
+                if highlight:
+                    lines.append(f"• **{label}:** £{value:,.0f} (£{per_pupil:,.0f} per pupil) ⭐")
+                else:
+                    lines.append(f"• {label}: £{value:,.0f} (£{per_pupil:,.0f} per pupil)")
+            else:
+                lines.append(f"• {label}: £{value:,.0f}")
+    return lines
+
+
 def display_financial_data(school: School):
     """Display financial data - UPDATED to highlight total staffing"""
     
@@ -492,30 +611,11 @@ def display_financial_data(school: School):
             else:
                 st.metric("Agency Supply", "£0")
         
-        # Detailed breakdown
+        # Detailed breakdown - pre-formatted and cached per URN, emitted
+        # as one markdown call instead of a st.write per line
         st.divider()
         st.write("**Cost Breakdown:**")
-        
-        costs = [
-            ("Total Staffing Costs", fin.total_teaching_support_costs, True),
-            ("Teaching Staff (E01)", fin.teaching_staff_costs, False),
-            ("Supply Teaching (E02)", fin.supply_teaching_costs, False),
-            ("Educational Support (E03)", fin.educational_support_costs, False),
-            ("Agency Supply (E26)", fin.agency_supply_costs, False),
-            ("Consultancy (E27)", fin.educational_consultancy_costs, False),
-        ]
-        
-        for label, value, highlight in costs:
-            if value and value > 0:
-                # Calculate per pupil if we have pupil count
-                if fin.total_pupils and fin.total_pupils > 0:
-                    per_pupil = value / fin.total_pupils
-                    if highlight:
-                        st.write(f"• **{label}:** £{value:,.0f} (£{per_pupil:,.0f} per pupil) ⭐")
-                    else:
-                        st.write(f"• {label}: £{value:,.0f} (£{per_pupil:,.0f} per pupil)")
-                else:
-                    st.write(f"• {label}: £{value:,.0f}")
+        st.markdown("\n\n".join(_cost_breakdown_lines(school.urn)))
         
         # Sales insight - now about total staffing
         st.divider()
@@ -533,11 +633,17 @@ def display_financial_data(school: School):
         st.info("No financial data available for this school")
 
 
-def display_full_details(school: School):
-    """Display all school details"""
-    
-    st.subheader("📋 Full School Details")
-    
+@st.cache_data(ttl=3600)
+def _details_rows(urn: str) -> list:
+    """Field/Value rows for the details table, cached per URN.
+
+    Keyed on the URN string (cheap to hash) rather than the School object
+    graph; strings pass through untouched instead of a redundant str().
+    """
+    school = _get_loader().get_school_by_urn(urn)
+    if not school:
+        return []
+
     details = {
         "URN": school.urn,
         "School Name": school.school_name,
@@ -552,20 +658,32 @@ def display_full_details(school: School):
         "Trust Name": school.trust_name or "N/A",
         "Sales Priority": school.get_sales_priority(),
     }
-    
+
     # Add financial summary
     if school.financial:
         details["Total Staffing Spend"] = school.financial.get_total_staffing_formatted()
         if school.financial.agency_supply_costs:
             details["Agency Spend"] = school.financial.get_agency_spend_formatted()
-    
-    df = pd.DataFrame([
-        {"Field": k, "Value": str(v) if v else "N/A"} 
+
+    return [
+        {"Field": k, "Value": (v if isinstance(v, str) else str(v)) if v else "N/A"}
         for k, v in details.items()
-    ])
-    
-    st.dataframe(df, hide_index=True, use_container_width=True)
-    
+    ]
+
+
+def display_full_details(school: School):
+    """Display all school details"""
+
+    st.subheader("📋 Full School Details")
+
+    # Plain list-of-dicts: st.dataframe renders it natively, so there is
+    # no reason to allocate a pandas BlockManager for an 11-row table
+    st.dataframe(
+        _details_rows(school.urn),
+        hide_index=True,
+        use_container_width=True,
+    )
+
     # Data source info
     st.divider()
     st.caption(f"📊 Data source: {school.data_source}")